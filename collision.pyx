@@ -0,0 +1,44 @@
+# collision.pyx
+# Compiled bullet-vs-wall test shared by the top-down valorant scripts.
+# Build in place with:  pip install cython && cythonize -i collision.pyx
+# Scripts fall back to an identical pure-Python version when this isn't built.
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+
+
+cdef inline bint seg_cross(double x1, double y1, double x2, double y2,
+                           double x3, double y3, double x4, double y4) noexcept nogil:
+    cdef double den = (y4 - y3) * (x2 - x1) - (x4 - x3) * (y2 - y1)
+    cdef double ua, ub
+    if den == 0:
+        return False
+    ua = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) / den
+    ub = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) / den
+    return 0 <= ua <= 1 and 0 <= ub <= 1
+
+
+cpdef bint seg_rect_hit(double px1, double py1, double px2, double py2,
+                        double[:, ::1] walls) noexcept nogil:
+    # walls: (W,4) rows of left, top, right, bottom
+    cdef Py_ssize_t i
+    cdef double l, t, r, b
+    cdef double x_lo = px1 if px1 < px2 else px2
+    cdef double x_hi = px2 if px1 < px2 else px1
+    cdef double y_lo = py1 if py1 < py2 else py2
+    cdef double y_hi = py2 if py1 < py2 else py1
+    for i in range(walls.shape[0]):
+        l = walls[i, 0]
+        t = walls[i, 1]
+        r = walls[i, 2]
+        b = walls[i, 3]
+        # segment bounding box misses the rect: no edge can be crossed
+        if x_hi < l or x_lo > r or y_hi < t or y_lo > b:
+            continue
+        if (seg_cross(px1, py1, px2, py2, l, t, r, t) or
+                seg_cross(px1, py1, px2, py2, r, t, r, b) or
+                seg_cross(px1, py1, px2, py2, r, b, l, b) or
+                seg_cross(px1, py1, px2, py2, l, b, l, t)):
+            return True
+        # either end inside (same half-open test as Rect.collidepoint)
+        if (l <= px1 < r and t <= py1 < b) or (l <= px2 < r and t <= py2 < b):
+            return True
+    return False
@@ -1,6 +1,7 @@
 from ursina import *
 from ursina.prefabs.first_person_controller import FirstPersonController
 import random
+import numpy as np
 
 app = Ursina()
 
@@ -23,8 +24,31 @@ for i in range(5):
                color=color.gray, collider='box')
     walls.append(w)
 
-# --- Player body ---
-player_body = Entity(model='cube', scale=(1,2,1), color=color.azure)
+# walls never move: keep their boxes as two contiguous (W,3) corner arrays for the bullet tests
+wall_mins = np.array([tuple(w.world_position - w.world_scale/2) for w in walls])
+wall_maxs = np.array([tuple(w.world_position + w.world_scale/2) for w in walls])
+
+def segment_hits_boxes(origin, direction, length, mins, maxs):
+    # slab test of one segment against many AABBs at once;
+    # returns the distance along the segment to each box (inf where it misses)
+    d = np.where(np.abs(direction) < 1e-9, 1e-9, direction)
+    t1 = (mins - origin) / d
+    t2 = (maxs - origin) / d
+    t_near = np.minimum(t1, t2).max(axis=1)
+    t_far = np.maximum(t1, t2).min(axis=1)
+    t_enter = np.maximum(t_near, 0.0)
+    hit = (t_far >= t_enter) & (t_near <= length)
+    return np.where(hit, t_enter, np.inf)
+
+# bot boxes for the bullet tests, refreshed once per frame in update()
+NUM_BOTS = 3
+bots = []  # filled once the Bot class exists
+active_bots = []    # bots that get an AI tick this frame
+disabled_bots = []  # dead bots waiting on their respawn
+MAX_AI_DIST = 40    # bots further than this from the player idle
+BOT_HALF = 0.6
+bot_positions = np.zeros((NUM_BOTS, 3))
+bot_enabled = np.zeros(NUM_BOTS, dtype=bool)
 
 player = FirstPersonController(model=None)
 player.gravity = 0.5
@@ -32,6 +56,10 @@ player.speed = 6
 player.position = (0,2,0)
 player.health = 100
 
+# --- Player body (child of the controller, so it follows without a per-frame sync) ---
+player_body = Entity(parent=player, model='cube', scale=(1,2,1), y=1, color=color.azure)
+PLAYER_BODY_HALF = np.array([0.5, 1.0, 0.5])
+
 # --- Camera (3rd person view) ---
 camera.parent = player
 camera.position = (0,3,-6)
@@ -42,42 +70,83 @@ class Bullet(Entity):
     def __init__(self, position, direction, owner="player"):
         super().__init__(
             model='sphere',
-            scale=0.2,
-            color=color.yellow if owner=="player" else color.red,
-            position=position,
-            collider='box'
+            scale=0.2
         )
-        self.direction = direction
         self.speed = 20
-        self.owner = owner
+        self.launch(position, direction, owner)
 
-    def update(self):
-        self.position += self.direction * time.dt * self.speed
-        # collide with walls
-        for w in walls:
-            if self.intersects(w).hit:
-                destroy(self)
-                return
-        # collide with bots
+    def launch(self, position, direction, owner):
+        # (re)arm the entity; pooled bullets go through here instead of a new Entity()
+        self.position = position
+        self.direction = direction
+        self.owner = owner
+        self.color = color.yellow if owner=="player" else color.red
+        # no collider needed: the segment travelled each frame is slab-tested against plain AABBs
+        self.dir_np = np.array(tuple(direction))
+        # direction never changes after firing, so keep the per-axis velocity as plain floats
+        self._vx = direction[0] * self.speed
+        self._vy = direction[1] * self.speed
+        self._vz = direction[2] * self.speed
+        self.enabled = True
+
+    def retire(self):
+        # park the bullet for reuse instead of destroy()
+        self.disable()
+        bullets.remove(self)
+        bullet_pool.append(self)
+
+    # module-level lookups are bound as defaults so the per-frame body only touches locals
+    def update(self, _hits=segment_hits_boxes, _wall_mins=wall_mins, _wall_maxs=wall_maxs,
+               _bots=bots, _bot_pos=bot_positions, _bot_on=bot_enabled, _player=player, _body_half=PLAYER_BODY_HALF):
+        dt = time.dt
+        reach = dt * self.speed + 0.1
+        d = self.dir_np
+        origin = np.array(tuple(self.world_position))
+        t_wall = _hits(origin, d, reach, _wall_mins, _wall_maxs).min()
+        # collide with bots (whichever box is reached before any wall)
         if self.owner == "player":
-            for b in bots:
-                if b.enabled and self.intersects(b).hit:
-                    b.health -= 50
-                    destroy(self)
-                    return
+            t = _hits(origin, d, reach, _bot_pos - BOT_HALF, _bot_pos + BOT_HALF)
+            t[~_bot_on] = np.inf
+            i = int(t.argmin())
+            if t[i] < t_wall:
+                _bots[i].health -= 50
+                self.retire()
+                return
         # collide with player
         elif self.owner == "bot":
-            if self.intersects(player_body).hit:
-                player.health -= 20
-                destroy(self)
+            center = np.array(tuple(_player.world_position)) + (0, 1, 0)
+            t = _hits(origin, d, reach, (center - _body_half)[None], (center + _body_half)[None])
+            if t[0] < t_wall:
+                _player.health -= 20
+                self.retire()
                 return
-
-bullets = []
+        # collide with walls
+        if t_wall < np.inf:
+            self.retire()
+            return
+        self.x += self._vx * dt
+        self.y += self._vy * dt
+        self.z += self._vz * dt
+
+bullets = []      # bullets in flight
+bullet_pool = []  # disabled bullets waiting to be fired again
+for _ in range(32):
+    b = Bullet((0,0,0), Vec3(0,0,1))
+    b.disable()
+    bullet_pool.append(b)
+
+def fire_bullet(position, direction, owner):
+    if bullet_pool:
+        b = bullet_pool.pop()
+        b.launch(position, direction, owner)
+    else:
+        b = Bullet(position, direction, owner)
+    bullets.append(b)
+    return b
 
 def shoot():
     direction = player.forward
-    b = Bullet(player.position + direction*1.5, direction, owner="player")
-    bullets.append(b)
+    fire_bullet(player.position + direction*1.5, direction, owner="player")
 
 # --- Bots (enemies) ---
 class Bot(Entity):
@@ -92,6 +161,20 @@ class Bot(Entity):
         self.speed = 3
         self.health = 100
         self.shoot_timer = 0
+        active_bots.append(self)
+
+    # keep active_bots/disabled_bots in step so the main loop never has to ask .enabled
+    def enable(self):
+        super().enable()
+        if self in disabled_bots:
+            disabled_bots.remove(self)
+            active_bots.append(self)
+
+    def disable(self):
+        super().disable()
+        if self in active_bots:
+            active_bots.remove(self)
+            disabled_bots.append(self)
 
     def update(self):
         if self.health <= 0:
@@ -101,15 +184,16 @@ class Bot(Entity):
             return
         # Move toward player
         dir = player.position - self.position
-        dist = dir.length()
-        if dist > 3:
+        dist_sq = dir.length_squared()  # compare squared, no sqrt for the range checks
+        if dist_sq > MAX_AI_DIST*MAX_AI_DIST:
+            return  # out of engagement range: idle
+        if dist_sq > 3*3:
             self.position += dir.normalized() * time.dt * self.speed
         # Shoot at player
         self.shoot_timer += time.dt
-        if dist < 20 and self.shoot_timer > 1.5:
+        if dist_sq < 20*20 and self.shoot_timer > 1.5:
             direction = dir.normalized()
-            b = Bullet(self.position + direction*1.5, direction, owner="bot")
-            bullets.append(b)
+            fire_bullet(self.position + direction*1.5, direction, owner="bot")
             self.shoot_timer = 0
 
     def respawn(self):
@@ -117,7 +201,12 @@ class Bot(Entity):
         self.position = (random.randint(-20,20), 1, random.randint(-20,20))
         self.health = 100
 
-bots = [Bot(position=(random.randint(-20,20),1,random.randint(-20,20))) for _ in range(3)]
+bots.extend(Bot(position=(random.randint(-20,20),1,random.randint(-20,20))) for _ in range(NUM_BOTS))
+
+def refresh_bot_boxes():
+    for i, bot in enumerate(bots):
+        bot_positions[i] = tuple(bot.world_position)
+        bot_enabled[i] = bot.enabled
 
 # --- Input ---
 def input(key):
@@ -126,19 +215,11 @@ def input(key):
 
 # --- Update loop ---
 def update():
-    # Keep player body synced
-    player_body.position = player.position
-    player_body.y = 1  # align properly
-
-    # Remove destroyed bullets
-    for b in bullets[:]:
-        if not b.enabled:
-            bullets.remove(b)
-
-    # Update bots
-    for bot in bots:
-        if bot.enabled:
-            bot.update()
+    refresh_bot_boxes()
+
+    # Update bots (copy: a bot that dies this frame moves itself to disabled_bots)
+    for bot in active_bots[:]:
+        bot.update()
 
     # Handle player death & respawn
     if player.health <= 0:
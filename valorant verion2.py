@@ -1,13 +1,15 @@
 # valorant.py
 # Mini-Valorant prototype (extended): improved UI, weapon switching, agent on-kill abilities,
 # and robust bullet-wall collision (segment-vs-rect).
-# Requires pygame: pip install pygame
+# Requires pygame and numpy: pip install pygame numpy
 
 import pygame
 import math
 import random
 import time 
 from collections import deque
+import bisect
+import numpy as np
 
 pygame.init()
 WIDTH, HEIGHT = 1200, 700
@@ -56,36 +58,52 @@ def normalize(v):
     return (v[0] / l, v[1] / l)
 
 
-# Segment intersection helper (for bullet-wall)
-def seg_intersect(a1, a2, b1, b2):
-    # a1,a2,b1,b2 = (x,y)
-    (x1, y1), (x2, y2) = a1, a2
-    (x3, y3), (x4, y4) = b1, b2
+# unit move direction for every (right-left, down-up) key combination
+_DIRS = {(x, y): normalize((x, y)) for x in (-1, 0, 1) for y in (-1, 0, 1)}
 
-    den = (y4 - y3) * (x2 - x1) - (x4 - x3) * (y2 - y1)
-    if den == 0:
+
+def dist_sq(dx, dy):
+    # squared length; enough for threshold checks and skips the sqrt
+    return dx * dx + dy * dy
+
+
+# Segment-vs-walls test (for bullet-wall). Uses the compiled collision.pyx
+# when it has been built (cythonize -i collision.pyx), else the same math in Python.
+# seg_walls converts a (W,4) wall array once into what that seg_rect_hit reads fastest.
+try:
+    from collision import seg_rect_hit
+
+    def seg_walls(walls_arr):
+        return walls_arr  # typed memoryview over the contiguous float array
+except ImportError:
+    def seg_walls(walls_arr):
+        return walls_arr.tolist()  # plain rows: unpacking floats beats indexing numpy per call
+
+    def seg_cross(x1, y1, x2, y2, x3, y3, x4, y4):
+        den = (y4 - y3) * (x2 - x1) - (x4 - x3) * (y2 - y1)
+        if den == 0:
+            return False
+        ua = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) / den
+        ub = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) / den
+        return 0 <= ua <= 1 and 0 <= ub <= 1
+
+    def seg_rect_hit(px1, py1, px2, py2, walls):
+        # walls: rows of left, top, right, bottom (from seg_walls)
+        x_lo, x_hi = (px1, px2) if px1 < px2 else (px2, px1)
+        y_lo, y_hi = (py1, py2) if py1 < py2 else (py2, py1)
+        for l, t, r, b in walls:
+            # segment bounding box misses the rect: no edge can be crossed
+            if x_hi < l or x_lo > r or y_hi < t or y_lo > b:
+                continue
+            if (seg_cross(px1, py1, px2, py2, l, t, r, t) or
+                    seg_cross(px1, py1, px2, py2, r, t, r, b) or
+                    seg_cross(px1, py1, px2, py2, r, b, l, b) or
+                    seg_cross(px1, py1, px2, py2, l, b, l, t)):
+                return True
+            # either end inside (same half-open test as Rect.collidepoint)
+            if (l <= px1 < r and t <= py1 < b) or (l <= px2 < r and t <= py2 < b):
+                return True
         return False
-    ua = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) / den
-    ub = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) / den
-    return 0 <= ua <= 1 and 0 <= ub <= 1
-
-
-def seg_rect_intersect(p1, p2, rect):
-    # check segment p1-p2 intersects any rect edge
-    rpts = [
-        (rect.left, rect.top),
-        (rect.right, rect.top),
-        (rect.right, rect.bottom),
-        (rect.left, rect.bottom),
-    ]
-    edges = [ (rpts[i], rpts[(i+1)%4]) for i in range(4) ]
-    for e in edges:
-        if seg_intersect(p1, p2, e[0], e[1]):
-            return True
-    # also if segment is completely inside rect
-    if rect.collidepoint(p1) or rect.collidepoint(p2):
-        return True
-    return False
 
 
 # --- Weapon system ---
@@ -106,7 +124,7 @@ class Weapon:
             return False
         return (now - self.last_shot) >= self.fire_rate and self.cur_mag > 0
 
-    def shoot(self, owner, target_pos, now):
+    def shoot(self, owner, target_pos, now, pool, ignore_idx):
         if self.reloading_until > now:
             return None
         if self.cur_mag <= 0:
@@ -119,7 +137,7 @@ class Weapon:
         angle = math.atan2(base[1], base[0])
         angle += math.radians(random.uniform(-self.spread_deg, self.spread_deg))
         vel = (math.cos(angle) * BULLET_SPEED, math.sin(angle) * BULLET_SPEED)
-        return Bullet(owner.pos[:], vel, owner, damage=self.dmg, created_now=now)
+        return pool.acquire(owner.pos, vel, owner, self.dmg, now, ignore_idx)
 
     def start_reload(self, now):
         if self.cur_mag == self.mag or self.reloading_until > now:
@@ -141,6 +159,7 @@ class Bullet:
         self.owner = owner
         self.spawn = created_now if created_now is not None else pygame.time.get_ticks() / 1000.0
         self.damage = damage
+        self.ignore_idx = -1  # owner's index in [player] + bots; never tested against it
 
     def update(self, dt):
         self.prev_pos[0] = self.pos[0]
@@ -152,6 +171,52 @@ class Bullet:
         return now - self.spawn > BULLET_LIFETIME
 
 
+class BulletPool:
+    # fixed set of Bullet objects reused across shots instead of allocating one per shot;
+    # `active` holds the live bullets in spawn order (`spawn_times` alongside),
+    # `free` the ones waiting to be fired again
+    def __init__(self, n=256):
+        self.free = [Bullet((0, 0), (0, 0), None, created_now=0) for _ in range(n)]
+        self.active = []
+        self.spawn_times = []
+
+    def acquire(self, pos, vel, owner, damage, now, ignore_idx):
+        b = self.free.pop() if self.free else Bullet((0, 0), (0, 0), None, created_now=0)
+        b.pos[0] = b.prev_pos[0] = pos[0]
+        b.pos[1] = b.prev_pos[1] = pos[1]
+        b.vel = vel
+        b.owner = owner
+        b.spawn = now
+        b.damage = damage
+        b.ignore_idx = ignore_idx
+        self.active.append(b)
+        self.spawn_times.append(now)
+        return b
+
+    def expire(self, cutoff):
+        # spawn times never decrease, so every bullet spawned before cutoff sits at the front
+        n = bisect.bisect_left(self.spawn_times, cutoff)
+        if n:
+            self.free.extend(self.active[:n])
+            del self.active[:n]
+            del self.spawn_times[:n]
+
+    def release(self, i):
+        # remove active[i], keeping the rest in spawn order
+        self.free.append(self.active.pop(i))
+        del self.spawn_times[i]
+
+    def truncate(self, n):
+        # drop everything after the first n live bullets (already moved to `free`)
+        del self.active[n:]
+        del self.spawn_times[n:]
+
+    def release_all(self):
+        self.free.extend(self.active)
+        self.active.clear()
+        self.spawn_times.clear()
+
+
 class Ability:
     def __init__(self, name, cooldown):
         self.name = name
@@ -186,6 +251,7 @@ class Player:
         self.shield = Ability("Shield", 15.0)
         self.shield_active_until = -1
         self.smokes = []  # active smoke circles (x,y,r,expiry)
+        self.shield_surf = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)  # reused shield ring
         # Weapon inventory
         self.weapons = {
             "Vandal": Weapon("Vandal", dmg=38, fire_rate=0.18, spread_deg=2.5, mag=25, reload_time=2.5),
@@ -267,16 +333,20 @@ walls = [
     pygame.Rect(900, 70, 40, 180),
     pygame.Rect(120, 470, 220, 40),
 ]
+# the same walls as a contiguous float array for seg_rect_hit
+walls_arr = np.array([(w.left, w.top, w.right, w.bottom) for w in walls], dtype=np.float64)
+walls_seg = seg_walls(walls_arr)  # converted once, not per bullet
 
 # Game state container for helper functions like killfeed
 class GameState:
     def __init__(self):
         self.player = Player(120, HEIGHT // 2, color=BLUE, name="You", agent="Phoenix")
         self.bots = []
-        self.bullets = []
+        self.bullet_pool = BulletPool()
+        self.bullets = self.bullet_pool.active  # live bullets (owned by the pool)
         self.round_start = pygame.time.get_ticks() / 1000.0
         self.round_end = self.round_start + ROUND_TIME
-        self.killfeed = deque(maxlen=6)  # recent messages
+        self.killfeed = deque(maxlen=6)  # recent (message, rendered surface) pairs
         self.last_kill_time = 0
 
     def spawn_bot(self):
@@ -288,7 +358,9 @@ class GameState:
 
     def add_killfeed(self, s):
         ts = time.strftime("%H:%M:%S")
-        self.killfeed.appendleft(f"[{ts}] {s}")
+        msg = f"[{ts}] {s}"
+        # messages never change once added, so render them a single time here
+        self.killfeed.appendleft((msg, FONT.render(msg, True, WHITE)))
 
 game_state = GameState()
 for _ in range(3):
@@ -297,34 +369,43 @@ for _ in range(3):
 now_time = lambda: pygame.time.get_ticks() / 1000.0
 
 # AI
-def bot_ai(bot, dt, now, gs: GameState):
-    if not bot.alive:
+def bot_ai_batch(dt, now, gs: GameState):
+    # steer every bot in one vectorized pass, then only loop over the bots that fire
+    bots = gs.bots
+    if not bots:
         return
     target = gs.player
-    dirv = (target.pos[0] - bot.pos[0], target.pos[1] - bot.pos[1])
-    dist = vec_len(dirv)
-    if dist > 200:
-        nd = normalize(dirv)
-        bot.vel[0] = nd[0] * BOT_SPEED
-        bot.vel[1] = nd[1] * BOT_SPEED
-    else:
-        ang = math.atan2(dirv[1], dirv[0]) + math.pi / 2
-        bot.vel[0] = math.cos(ang) * (BOT_SPEED * 0.55)
-        bot.vel[1] = math.sin(ang) * (BOT_SPEED * 0.55)
-
-    if dist < 520:
-        if getattr(bot, "bot_last_shot", 0) + BOT_FIRE_RATE <= now:
-            w = bot.weapon
-            if w.cur_mag <= 0 and w.reloading_until < now:
-                w.start_reload(now)
-            elif w.ready(now):
-                b = w.shoot(bot, target.pos, now)
-                if b:
-                    gs.bullets.append(b)
-                bot.bot_last_shot = now
-
-
-def shoot_from(shooter, target_pos, now, gs: GameState):
+    bot_pos = np.array([b.pos for b in bots], dtype=np.float64)
+    alive = np.array([b.alive for b in bots])
+    last_shot = np.array([getattr(b, "bot_last_shot", 0) for b in bots], dtype=np.float64)
+    dxy = np.asarray(target.pos, dtype=np.float64) - bot_pos
+    d2 = dist_sq(dxy[:, 0], dxy[:, 1])
+    d = np.sqrt(d2)
+    # unit direction to the player ((1, 0) when on top of it, like atan2(0, 0) == 0)
+    nd = np.where(d[:, None] > 0, dxy / np.maximum(d, 1e-12)[:, None], (1.0, 0.0))
+    far = d2 > 200 * 200
+    near = ~far
+    vel = np.empty_like(dxy)
+    vel[far] = nd[far] * BOT_SPEED
+    # strafe: direction rotated by +90 degrees
+    vel[near, 0] = -nd[near, 1] * (BOT_SPEED * 0.55)
+    vel[near, 1] = nd[near, 0] * (BOT_SPEED * 0.55)
+    for bot, v, a in zip(bots, vel.tolist(), alive.tolist()):
+        if a:
+            bot.vel[0], bot.vel[1] = v
+
+    can_shoot = alive & (d2 < 520 * 520) & (last_shot + BOT_FIRE_RATE <= now)
+    for i in np.nonzero(can_shoot)[0]:
+        bot = bots[i]
+        w = bot.weapon
+        if w.cur_mag <= 0 and w.reloading_until < now:
+            w.start_reload(now)
+        elif w.ready(now):
+            w.shoot(bot, target.pos, now, gs.bullet_pool, i + 1)  # targets are [player] + bots
+            bot.bot_last_shot = now
+
+
+def shoot_from(shooter, target_pos, now, gs: GameState, ignore_idx):
     if not shooter.alive:
         return
     w = shooter.weapon
@@ -335,24 +416,30 @@ def shoot_from(shooter, target_pos, now, gs: GameState):
         return
     if not w.ready(now):
         return
-    b = w.shoot(shooter, target_pos, now)
-    if b:
-        gs.bullets.append(b)
+    w.shoot(shooter, target_pos, now, gs.bullet_pool, ignore_idx)
 
 
 def handle_player_shoot(mouse_pos, now, gs: GameState):
     p = gs.player
     if not p.alive:
         return
-    shoot_from(p, mouse_pos, now, gs)
+    shoot_from(p, mouse_pos, now, gs, 0)
 
 
-def bullet_hits_player(b, p):
-    if not p.alive:
-        return False
-    dx = b.pos[0] - p.pos[0]
-    dy = b.pos[1] - p.pos[1]
-    return dx * dx + dy * dy <= (p.radius) ** 2
+def bullet_target_hits(bullets, targets):
+    # one broadcast over every (bullet, target) pair instead of a nested Python loop;
+    # returns, per bullet, the index of the first target it overlaps or -1
+    bxy = np.array([b.pos for b in bullets], dtype=np.float64)
+    txy = np.array([t.pos for t in targets], dtype=np.float64)
+    r2 = np.array([t.radius ** 2 if t.alive else -1.0 for t in targets])
+    ignore_idx = np.fromiter((b.ignore_idx for b in bullets), dtype=np.intp, count=len(bullets))
+    diff = bxy[:, None, :] - txy[None, :, :]
+    d2 = (diff * diff).sum(-1)
+    rows = np.arange(len(bullets))
+    d2[rows, ignore_idx] = np.inf  # bullets never hit their owner
+    hits = d2 <= r2[None, :]
+    first = np.argmax(hits, axis=1)
+    return np.where(hits[rows, first], first, -1)
 
 
 # --- Drawing helpers for improved UI ---
@@ -365,6 +452,54 @@ def draw_text(surf, text, x, y, color=WHITE, font=FONT):
     surf.blit(font.render(text, True, color), (x, y))
 
 
+# persistent smoke overlay: allocated once, only the area covered by smokes is cleared and blitted
+SMOKE_SURF = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+
+def draw_smokes(surf, smokes):
+    if not smokes:
+        return
+    rects = [pygame.Rect(int(s[0]) - int(s[2]), int(s[1]) - int(s[2]), int(s[2]) * 2, int(s[2]) * 2) for s in smokes]
+    union_rect = rects[0].unionall(rects[1:]).clip(SMOKE_SURF.get_rect())
+    if not union_rect:
+        return
+    SMOKE_SURF.fill((0, 0, 0, 0), union_rect)
+    for s in smokes:
+        pygame.draw.circle(SMOKE_SURF, SMOKE_COLOR, (int(s[0]), int(s[1])), int(s[2]))
+    surf.blit(SMOKE_SURF, union_rect.topleft, area=union_rect)
+
+
+# pre-rendered bullet sprites (player / bot), blitted instead of drawing a circle per bullet
+def make_bullet_surf(color):
+    surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (5, 5), 4)
+    return surf.convert_alpha()
+
+
+BULLET_SURF_P = make_bullet_surf(YELLOW)
+BULLET_SURF_B = make_bullet_surf(RED)
+
+
+# static HUD text, rendered once at startup
+HINT_TEXT = FONT.render("Switch weapon: [1] Vandal  [2] Phantom  [3] Sheriff  | Reload: R | Agents: F1/F2/F3", True, WHITE)
+KILLFEED_TITLE = BIG_FONT.render("Killfeed", True, WHITE)
+
+# HP/ammo readouts, keyed by the values shown (oldest entry dropped past the cap)
+STAT_CACHE_SIZE = 128
+_stat_cache = {}
+
+
+def stat_text(label, value, maximum):
+    key = (label, value, maximum)
+    surf = _stat_cache.get(key)
+    if surf is None:
+        if len(_stat_cache) >= STAT_CACHE_SIZE:
+            del _stat_cache[next(iter(_stat_cache))]
+        surf = FONT.render(f"{label}: {value}/{maximum}", True, WHITE)
+        _stat_cache[key] = surf
+    return surf
+
+
 def draw_crosshair(surf, pos, spread_px=0):
     x, y = pos
     # center dot
@@ -388,7 +523,9 @@ while running:
     gs = game_state
     player = gs.player
 
-    for event in pygame.event.get():
+    events = pygame.event.get()
+    mouse_pos = pygame.mouse.get_pos()  # read once per frame
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -396,7 +533,7 @@ while running:
                 mouse_down = True
             elif event.button == 3:
                 if player.smoke.ready(now):
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = mouse_pos
                     player.smokes.append([mx, my, 120, now + 8.0])
                     player.smoke.trigger(now)
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -405,7 +542,7 @@ while running:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 if player.dash.ready(now) and player.alive:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = mouse_pos
                     dirv = normalize((mx - player.pos[0], my - player.pos[1]))
                     dash_dist = 180
                     player.pos[0] += dirv[0] * dash_dist
@@ -433,25 +570,16 @@ while running:
             elif event.key == pygame.K_e:
                 # manual: use small local action (plant test): smoke thrown
                 if player.smoke.ready(now):
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = mouse_pos
                     player.smokes.append([mx, my, 120, now + 8.0])
                     player.smoke.trigger(now)
 
     # keyboard movement
     if player.alive:
         keys = pygame.key.get_pressed()
-        mx, my = pygame.mouse.get_pos()
+        mx, my = mouse_pos
         player.angle = math.atan2(my - player.pos[1], mx - player.pos[0])
-        vx = vy = 0
-        if keys[pygame.K_w]:
-            vy -= 1
-        if keys[pygame.K_s]:
-            vy += 1
-        if keys[pygame.K_a]:
-            vx -= 1
-        if keys[pygame.K_d]:
-            vx += 1
-        norm = normalize((vx, vy))
+        norm = _DIRS[(keys[pygame.K_d] - keys[pygame.K_a], keys[pygame.K_s] - keys[pygame.K_w])]
         player.vel[0] = norm[0] * PLAYER_SPEED
         player.vel[1] = norm[1] * PLAYER_SPEED
     else:
@@ -459,56 +587,55 @@ while running:
 
     # Handle firing
     if mouse_down:
-        handle_player_shoot(pygame.mouse.get_pos(), now, gs)
+        handle_player_shoot(mouse_pos, now, gs)
 
     # Update player
     player.update(dt, now)
 
     # Update bots
+    bot_ai_batch(dt, now, gs)
     for b in gs.bots:
-        bot_ai(b, dt, now, gs)
         b.update(dt, now)
 
     # Update bullets with segment-vs-rect checks
-    for b in gs.bullets[:]:
+    pool = gs.bullet_pool
+    # lifetime: expired bullets are a prefix of the spawn-ordered list
+    pool.expire(now - BULLET_LIFETIME)
+    # one in-place pass: move, drop wall hits, pack the survivors to the front
+    spawn_times = pool.spawn_times
+    keep = 0
+    for i, b in enumerate(gs.bullets):
         b.update(dt)
-        # check lifetime
-        if b.is_expired(now):
-            gs.bullets.remove(b)
-            continue
         # check segment intersection with walls (prevents tunneling)
-        hit_wall = False
-        for w in walls:
-            if seg_rect_intersect(tuple(b.prev_pos), tuple(b.pos), w):
-                hit_wall = True
-                break
-        if hit_wall:
-            try:
-                gs.bullets.remove(b)
-            except ValueError:
-                pass
+        if seg_rect_hit(b.prev_pos[0], b.prev_pos[1], b.pos[0], b.pos[1], walls_seg):
+            pool.free.append(b)
             continue
-        # collision with players
-        targets = [player] + gs.bots
-        hit_any = False
-        for t in targets:
-            if t is b.owner:
+        gs.bullets[keep] = b
+        spawn_times[keep] = spawn_times[i]
+        keep += 1
+    pool.truncate(keep)
+
+    # collision with players (all bullets vs all targets at once)
+    targets = [player] + gs.bots
+    if gs.bullets:
+        hit_idx = bullet_target_hits(gs.bullets, targets)
+        spent = []
+        for bi, (b, ti) in enumerate(zip(gs.bullets, hit_idx.tolist())):
+            if ti < 0:
                 continue
-            if bullet_hits_player(b, t):
-                t.take_damage(b.damage, now)
-                # awarding kill if died
-                if not t.alive:
-                    b.owner.kills += 1
-                    b.owner.on_kill(t, now, gs)
-                    gs.add_killfeed(f"{b.owner.name} killed {t.name}")
-                try:
-                    gs.bullets.remove(b)
-                except ValueError:
-                    pass
-                hit_any = True
-                break
-        if hit_any:
-            continue
+            t = targets[ti]
+            if not t.alive:
+                # already killed by an earlier bullet this frame
+                continue
+            t.take_damage(b.damage, now)
+            # awarding kill if died
+            if not t.alive:
+                b.owner.kills += 1
+                b.owner.on_kill(t, now, gs)
+                gs.add_killfeed(f"{b.owner.name} killed {t.name}")
+            spent.append(bi)
+        for bi in reversed(spent):
+            pool.release(bi)
 
     # Round timer
     if now >= gs.round_end:
@@ -517,7 +644,7 @@ while running:
             ent.respawn_time = 0
             ent.hp = ent.max_hp
             ent.pos = [random.randint(80, WIDTH - 80), random.randint(80, HEIGHT - 80)]
-        gs.bullets.clear()
+        gs.bullet_pool.release_all()
         gs.round_start = now
         gs.round_end = gs.round_start + ROUND_TIME
         gs.add_killfeed("Round reset")
@@ -530,15 +657,13 @@ while running:
         pygame.draw.rect(screen, GRAY, w)
 
     # smokes (player)
-    surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for s in player.smokes:
-        pygame.draw.circle(surf, SMOKE_COLOR, (int(s[0]), int(s[1])), int(s[2]))
-    screen.blit(surf, (0, 0))
+    draw_smokes(screen, player.smokes)
 
-    # bullets
-    for b in gs.bullets:
-        col = YELLOW if b.owner is player else RED
-        pygame.draw.circle(screen, col, (int(b.pos[0]), int(b.pos[1])), 4)
+    # bullets: one batched blits() per colour instead of alternating draw calls
+    player_bullets = [b for b in gs.bullets if b.owner is player]
+    bot_bullets = [b for b in gs.bullets if b.owner is not player]
+    screen.blits([(BULLET_SURF_P, (int(b.pos[0]) - 5, int(b.pos[1]) - 5)) for b in player_bullets], False)
+    screen.blits([(BULLET_SURF_B, (int(b.pos[0]) - 5, int(b.pos[1]) - 5)) for b in bot_bullets], False)
 
     # bots
     for b in gs.bots:
@@ -564,7 +689,8 @@ while running:
         if player.shield_active_until > now:
             a = int(120 * (player.shield_active_until - now) / 4.0)
             # shield ring
-            surf2 = pygame.Surface((int(player.radius*4), int(player.radius*4)), pygame.SRCALPHA)
+            surf2 = player.shield_surf
+            surf2.fill((0, 0, 0, 0))
             pygame.draw.circle(surf2, (180,220,255,a), (int(player.radius*2), int(player.radius*2)), int(player.radius*1.8), 2)
             screen.blit(surf2, (int(player.pos[0]-player.radius*2), int(player.pos[1]-player.radius*2)))
         # hp bar
@@ -576,14 +702,14 @@ while running:
     # HUD left panel (rounded simplified)
     hud_rect = pygame.Rect(8, HEIGHT - 110, 360, 96)
     draw_panel(screen, hud_rect)
-    draw_text(screen, f"HP: {int(player.hp)}/{player.max_hp}", 26, HEIGHT - 104)
+    screen.blit(stat_text("HP", int(player.hp), player.max_hp), (26, HEIGHT - 104))
     draw_text(screen, f"Agent: {player.agent}", 26, HEIGHT - 82)
     # weapon box
     wrect = pygame.Rect(220, HEIGHT - 96, 128, 72)
     pygame.draw.rect(screen, (22,22,26), wrect)
     pygame.draw.rect(screen, ACCENT, wrect, 2)
     draw_text(screen, f"Weapon: {player.weapon.name}", 232, HEIGHT - 92)
-    draw_text(screen, f"Ammo: {player.weapon.cur_mag}/{player.weapon.mag}", 232, HEIGHT - 72)
+    screen.blit(stat_text("Ammo", player.weapon.cur_mag, player.weapon.mag), (232, HEIGHT - 72))
     # ability cooldown bars
     def cooldown_bar(x,y, label, ability, width=140, height=8):
         cd = max(0, ability.cooldown - (now - ability.last))
@@ -598,17 +724,17 @@ while running:
     # center crosshair
     # spread indicator based on weapon spread
     spread_px = int(player.weapon.spread_deg * 0.8)
-    draw_crosshair(screen, pygame.mouse.get_pos(), spread_px)
+    draw_crosshair(screen, mouse_pos, spread_px)
 
     # right-top killfeed panel
     kx, ky = WIDTH - 420, 16
     krect = pygame.Rect(kx, ky, 400, 140)
     pygame.draw.rect(screen, (14,14,18), krect)
     pygame.draw.rect(screen, ACCENT, krect, 2)
-    draw_text(screen, "Killfeed", kx+10, ky+6, font=BIG_FONT)
+    screen.blit(KILLFEED_TITLE, (kx+10, ky+6))
     i = 0
-    for msg in gs.killfeed:
-        draw_text(screen, msg, kx+10, ky+40 + i*18, color=WHITE)
+    for msg, msg_surf in gs.killfeed:
+        screen.blit(msg_surf, (kx+10, ky+40 + i*18))
         i += 1
 
     # bottom center round timer + info
@@ -616,7 +742,7 @@ while running:
     draw_text(screen, f"Kills: {player.kills}  Deaths: {player.deaths}", WIDTH//2 - 90, 36)
 
     # weapon switch hints
-    draw_text(screen, "Switch weapon: [1] Vandal  [2] Phantom  [3] Sheriff  | Reload: R | Agents: F1/F2/F3", 16, 16)
+    screen.blit(HINT_TEXT, (16, 16))
 
     # bots scoreboard
     y = 160
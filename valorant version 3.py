@@ -7,14 +7,21 @@
 # - Player can heal up to 3 times per round with 'H'
 # - Human-shaped players (body/head/legs) and visible gun
 #
-# Requires: pygame
-# pip install pygame
+# Requires: pygame, numpy (numba optional, JIT-compiles the bullet-vs-wall kernel)
+# pip install pygame numpy
 
 import pygame
 import math
 import random
 import time
+import multiprocessing
+from array import array
 from collections import deque
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 pygame.init()
 WIDTH, HEIGHT = 1400, 700
@@ -28,9 +35,13 @@ BIG_FONT = pygame.font.SysFont("consolas", 24)
 PLAYER_SPEED = 260
 PLAYER_RADIUS = 14  # collision radius used for movement/wall checks
 BULLET_LIFETIME = 1.2
+MAX_BULLETS = 256  # preallocated bullet slots (doubles if ever exceeded)
 BOT_SPEED = 160
 ROUND_TIME = 90
 RESPAWN_DELAY = 3
+BOT_AI_PROCESSES = 0  # >0: think for bots in that many worker processes (needs fork); 0: in-process
+BOT_AI_EVERY = 2      # frames between worker dispatches when BOT_AI_PROCESSES is on
+BOT_AI_POOL_MIN_BOTS = 64  # below this many bots the IPC round trip costs more than bot_ai_batch
 
 # Colors
 WHITE = (245, 245, 245)
@@ -57,44 +68,140 @@ def normalize(v):
         return (0, 0)
     return (v[0]/l, v[1]/l)
 
-# Segment intersection helper (bullet vs rect)
-def seg_intersect(a1, a2, b1, b2):
-    (x1,y1),(x2,y2)=a1,a2
-    (x3,y3),(x4,y4)=b1,b2
-    den = (y4-y3)*(x2-x1) - (x4-x3)*(y2-y1)
-    if den == 0:
+# unit move direction for every (right-left, down-up) key combination
+_DIRS = {(x, y): normalize((x, y)) for x in (-1, 0, 1) for y in (-1, 0, 1)}
+
+def vec2(x, y):
+    # position/velocity as two packed C doubles instead of a list of two float objects
+    return array('d', (x, y))
+
+def dist_sq(dx, dy):
+    # squared length; enough for threshold checks and skips the sqrt
+    return dx*dx + dy*dy
+
+# Segment-vs-walls test (bullet vs rect). Compiled collision.pyx if built
+# (cythonize -i collision.pyx), otherwise the same math in Python.
+# seg_walls converts a (W,4) wall array once into what that seg_rect_hit reads fastest.
+try:
+    from collision import seg_rect_hit
+
+    def seg_walls(walls_arr):
+        return walls_arr  # typed memoryview over the contiguous float array
+except ImportError:
+    def seg_walls(walls_arr):
+        return walls_arr.tolist()  # plain rows: unpacking floats beats indexing numpy per call
+
+    def seg_cross(x1, y1, x2, y2, x3, y3, x4, y4):
+        den = (y4-y3)*(x2-x1) - (x4-x3)*(y2-y1)
+        if den == 0:
+            return False
+        ua = ((x4-x3)*(y1-y3) - (y4-y3)*(x1-x3))/den
+        ub = ((x2-x1)*(y1-y3) - (y2-y1)*(x1-x3))/den
+        return 0<=ua<=1 and 0<=ub<=1
+
+    def seg_rect_hit(px1, py1, px2, py2, walls):
+        # walls: rows of left, top, right, bottom (from seg_walls)
+        x_lo, x_hi = (px1, px2) if px1 < px2 else (px2, px1)
+        y_lo, y_hi = (py1, py2) if py1 < py2 else (py2, py1)
+        for l, t, r, b in walls:
+            # segment bbox misses the rect: no edge can be crossed
+            if x_hi < l or x_lo > r or y_hi < t or y_lo > b:
+                continue
+            if (seg_cross(px1,py1,px2,py2, l,t,r,t) or seg_cross(px1,py1,px2,py2, r,t,r,b) or
+                    seg_cross(px1,py1,px2,py2, r,b,l,b) or seg_cross(px1,py1,px2,py2, l,b,l,t)):
+                return True
+            # also if either end inside rect (half-open, like Rect.collidepoint)
+            if (l <= px1 < r and t <= py1 < b) or (l <= px2 < r and t <= py2 < b):
+                return True
         return False
-    ua = ((x4-x3)*(y1-y3) - (y4-y3)*(x1-x3))/den
-    ub = ((x2-x1)*(y1-y3) - (y2-y1)*(x1-x3))/den
-    return 0<=ua<=1 and 0<=ub<=1
-
-def seg_rect_intersect(p1,p2,rect):
-    rpts = [(rect.left,rect.top),(rect.right,rect.top),(rect.right,rect.bottom),(rect.left,rect.bottom)]
-    edges = [ (rpts[i], rpts[(i+1)%4]) for i in range(4) ]
-    for e in edges:
-        if seg_intersect(p1,p2,e[0],e[1]):
-            return True
-    # also if either end inside rect
-    if rect.collidepoint(p1) or rect.collidepoint(p2):
-        return True
-    return False
+
+# Bullet segments vs walls, one (segment, box) pair per row: p1[k] -> p2[k] against boxes[k]
+# (left, top, right, bottom), returns a uint8 hit per pair. Native loop under numba (same
+# test as seg_rect_hit), else one seg_rect_hit call per pair.
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _seg_cross(x1, y1, x2, y2, x3, y3, x4, y4):
+        den = (y4-y3)*(x2-x1) - (x4-x3)*(y2-y1)
+        if den == 0:
+            return False
+        ua = ((x4-x3)*(y1-y3) - (y4-y3)*(x1-x3))/den
+        ub = ((x2-x1)*(y1-y3) - (y2-y1)*(x1-x3))/den
+        return 0<=ua<=1 and 0<=ub<=1
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def seg_box_hits(p1, p2, boxes):
+        n = p1.shape[0]
+        out = np.zeros(n, np.uint8)
+        for k in range(n):
+            px1, py1 = p1[k,0], p1[k,1]
+            px2, py2 = p2[k,0], p2[k,1]
+            l, t, r, b = boxes[k,0], boxes[k,1], boxes[k,2], boxes[k,3]
+            if (_seg_cross(px1,py1,px2,py2, l,t,r,t) or _seg_cross(px1,py1,px2,py2, r,t,r,b) or
+                    _seg_cross(px1,py1,px2,py2, r,b,l,b) or _seg_cross(px1,py1,px2,py2, l,b,l,t) or
+                    (l <= px1 < r and t <= py1 < b) or (l <= px2 < r and t <= py2 < b)):
+                out[k] = 1
+        return out
+else:
+    def seg_box_hits(p1, p2, boxes):
+        rows = seg_walls(boxes)  # converted once for all pairs
+        return np.array([seg_rect_hit(x1, y1, x2, y2, rows[k:k+1])
+                         for k, ((x1, y1), (x2, y2)) in enumerate(zip(p1.tolist(), p2.tolist()))], dtype=np.uint8)
+
+def seg_walls_hit(prev, cur, walls):
+    # all bullets (prev[i] -> cur[i]) vs all walls, returns a bool hit mask over the bullets.
+    # broadphase: the (bullets, walls) overlap mask of each segment's bounding box; only the
+    # overlapping pairs reach the exact test
+    lo = np.minimum(prev, cur)
+    hi = np.maximum(prev, cur)
+    near = ((hi[:,None,0] >= walls[None,:,0]) & (lo[:,None,0] <= walls[None,:,2]) &
+            (hi[:,None,1] >= walls[None,:,1]) & (lo[:,None,1] <= walls[None,:,3]))
+    bi, wi = np.nonzero(near)
+    hit = np.zeros(len(prev), dtype=bool)
+    if len(bi):
+        hit[bi[seg_box_hits(prev[bi], cur[bi], walls[wi]) != 0]] = True
+    return hit
 
 # Circle-rect collision (for player/bot)
 def circle_rect_collision(circle_pos, r, rect):
     cx, cy = circle_pos
-    closest_x = clamp(cx, rect.left, rect.right)
-    closest_y = clamp(cy, rect.top, rect.bottom)
-    dx = cx - closest_x
-    dy = cy - closest_y
+    # closest point of the rect to the centre (plain conditionals, no min/max calls)
+    tx = rect.left if cx < rect.left else (rect.right if cx > rect.right else cx)
+    ty = rect.top if cy < rect.top else (rect.bottom if cy > rect.bottom else cy)
+    dx = cx - tx
+    dy = cy - ty
     return dx*dx + dy*dy < r*r
 
+def circle_walls_any(cx, cy, r_sq, walls_np):
+    # circle_rect_collision against every wall at once; walls_np rows are left, top, right, bottom.
+    # takes the squared radius so callers can pass their precomputed radius_sq
+    tx = np.clip(cx, walls_np[:,0], walls_np[:,2])
+    ty = np.clip(cy, walls_np[:,1], walls_np[:,3])
+    return bool(((cx-tx)**2 + (cy-ty)**2 < r_sq).any())
+
+def circles_walls_hit(cx, cy, r_sq, walls_np):
+    # same test for several circles at once (cx, cy: 1-D arrays); True per circle touching any wall
+    tx = np.clip(cx[:,None], walls_np[:,0], walls_np[:,2])
+    ty = np.clip(cy[:,None], walls_np[:,1], walls_np[:,3])
+    return ((cx[:,None]-tx)**2 + (cy[:,None]-ty)**2 < r_sq).any(axis=1)
+
+def wall_candidates(walls_list, x_lo, y_lo, x_hi, y_hi, r):
+    # broadphase: indices of the walls overlapping the box around every circle of radius r centred
+    # in [x_lo,x_hi] x [y_lo,y_hi]; one Rect.collidelistall C call, padded a pixel for int truncation
+    left, top = math.floor(x_lo - r), math.floor(y_lo - r)
+    box = pygame.Rect(left, top, math.ceil(x_hi + r) - left + 1, math.ceil(y_hi + r) - top + 1)
+    return box.collidelistall(walls_list)
+
 # --- Weapon ---
 class Weapon:
+    __slots__ = ("name", "dmg", "fire_rate", "spread_deg", "spread_rad", "mag", "reload_time",
+                 "bullet_speed", "cur_mag", "last_shot", "reloading_until")
+
     def __init__(self, name, dmg, fire_rate, spread_deg, mag, reload_time, bullet_speed):
         self.name = name
         self.dmg = dmg
         self.fire_rate = fire_rate
         self.spread_deg = spread_deg
+        self.spread_rad = math.radians(spread_deg)
         self.mag = mag
         self.reload_time = reload_time
         self.bullet_speed = bullet_speed
@@ -107,7 +214,7 @@ class Weapon:
             return False
         return (now - self.last_shot) >= self.fire_rate and self.cur_mag > 0
 
-    def shoot(self, owner, target_pos, now):
+    def shoot(self, owner, target_pos, now, bullets, owner_idx):
         if self.reloading_until > now:
             return None
         if self.cur_mag <= 0:
@@ -118,9 +225,9 @@ class Weapon:
         dy = target_pos[1] - owner.pos[1]
         base = normalize((dx, dy))
         angle = math.atan2(base[1], base[0])
-        angle += math.radians(random.uniform(-self.spread_deg, self.spread_deg))
+        angle += random.uniform(-self.spread_rad, self.spread_rad)
         vel = (math.cos(angle)*self.bullet_speed, math.sin(angle)*self.bullet_speed)
-        return Bullet(owner.pos[:], vel, owner, damage=self.dmg, created_now=now)
+        return bullets.spawn_bullet(owner.pos, vel, owner_idx, self.dmg, now)
 
     def start_reload(self, now):
         if self.cur_mag == self.mag or self.reloading_until > now:
@@ -133,25 +240,74 @@ class Weapon:
             self.reloading_until = -1
 
 # --- Game Objects ---
-class Bullet:
-    def __init__(self, pos, vel, owner, damage=34, created_now=None):
-        self.pos = list(pos)
-        self.prev_pos = list(pos)
-        self.vel = vel
-        self.owner = owner
-        self.spawn = created_now if created_now is not None else pygame.time.get_ticks()/1000.0
-        self.damage = damage
-
-    def update(self, dt):
-        self.prev_pos[0] = self.pos[0]
-        self.prev_pos[1] = self.pos[1]
-        self.pos[0] += self.vel[0]*dt
-        self.pos[1] += self.vel[1]*dt
-
-    def is_expired(self, now):
-        return now - self.spawn > BULLET_LIFETIME
+class BulletArrays:
+    # all live bullets as rows of parallel arrays (structure of arrays), packed at the
+    # front in spawn order; `owner` is the shooter's index in [player] + bots.
+    # Every array has a same-sized spare: compact() filters into the spares and swaps them in,
+    # so once allocated the buffers are reused for the whole game.
+    FIELDS = ("pos", "prev", "vel", "owner", "dmg", "spawn")
+    __slots__ = ("n", "_spare", "_step") + FIELDS
+
+    def __init__(self, cap=MAX_BULLETS):
+        self.n = 0
+        self.pos = np.zeros((cap,2))
+        self.prev = np.zeros((cap,2))
+        self.vel = np.zeros((cap,2))
+        self.owner = np.zeros(cap, dtype=np.intp)
+        self.dmg = np.zeros(cap, dtype=np.int64)  # weapon damage is whole numbers
+        self.spawn = np.zeros(cap)
+        self._spare = {name: np.zeros_like(getattr(self, name)) for name in self.FIELDS}
+        self._step = np.zeros((cap,2))  # vel*dt scratch
+
+    def grow(self):
+        cap = 2*len(self.spawn)
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros((cap,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+            self._spare[name] = np.zeros_like(new)
+        self._step = np.zeros((cap,2))
+
+    def spawn_bullet(self, pos, vel, owner_idx, damage, now):
+        if self.n == len(self.spawn):
+            self.grow()
+        i = self.n
+        self.pos[i] = pos
+        self.prev[i] = pos
+        self.vel[i] = vel
+        self.owner[i] = owner_idx
+        self.dmg[i] = damage
+        self.spawn[i] = now
+        self.n = i + 1
+
+    def step(self, dt):
+        n = self.n
+        self.prev[:n] = self.pos[:n]
+        d = self._step[:n]
+        np.multiply(self.vel[:n], dt, out=d)
+        self.pos[:n] += d
+
+    def compact(self, keep):
+        # keep: bool mask over the n live rows; survivors stay packed and in order
+        n = self.n
+        m = int(np.count_nonzero(keep))
+        if m == n:
+            return
+        spare = self._spare
+        for name in self.FIELDS:
+            a = getattr(self, name)
+            b = spare[name]
+            np.compress(keep, a[:n], axis=0, out=b[:m])
+            setattr(self, name, b)
+            spare[name] = a
+        self.n = m
+
+    def clear(self):
+        self.n = 0
 
 class Ability:
+    __slots__ = ("name", "cooldown", "last")
     def __init__(self, name, cooldown):
         self.name = name
         self.cooldown = cooldown
@@ -161,15 +317,29 @@ class Ability:
     def trigger(self, now):
         self.last = now
 
+CROSSHAIR_LEN = 8
+
+def weapon_ui(w):
+    # crosshair/HUD numbers that only depend on the held weapon, rebuilt on switch
+    spread_px = int(w.spread_deg*0.8)
+    gap = 10 + spread_px
+    return {"spread_px": spread_px, "gap": gap, "outer": gap + CROSSHAIR_LEN, "label": f"Weapon: {w.name}"}
+
 class Player:
+    __slots__ = ("pos", "vel", "color", "angle", "hp", "max_hp", "radius", "radius_sq", "name",
+                 "kills", "deaths", "alive", "respawn_time", "dash", "smoke", "shield",
+                 "shield_active_until", "smokes", "medkits", "weapons", "weapon_order",
+                 "cur_weapon_idx", "weapon_ui", "agent", "revealed_until", "bot_last_shot")
+
     def __init__(self, x, y, color=BLUE, name="Player", agent="Phoenix"):
-        self.pos = [x,y]
-        self.vel = [0,0]
+        self.pos = vec2(x,y)
+        self.vel = vec2(0,0)
         self.color = color
         self.angle = 0
         self.hp = 100
         self.max_hp = 100
         self.radius = PLAYER_RADIUS
+        self.radius_sq = PLAYER_RADIUS*PLAYER_RADIUS  # keep in step with radius
         self.name = name
         self.kills = 0
         self.deaths = 0
@@ -190,9 +360,11 @@ class Player:
         }
         self.weapon_order = ["Vandal","Phantom","Sheriff"]
         self.cur_weapon_idx = 0
+        self.weapon_ui = weapon_ui(self.weapon)
         self.agent = agent
         # agent-specific
         self.revealed_until = -1
+        self.bot_last_shot = 0  # only used when a bot AI drives this player
 
     @property
     def weapon(self):
@@ -201,38 +373,44 @@ class Player:
     def switch_weapon(self, idx):
         if 0 <= idx < len(self.weapon_order):
             self.cur_weapon_idx = idx
+            self.weapon_ui = weapon_ui(self.weapon)
 
-    def update(self, dt, now, walls_list):
+    def update(self, dt, now, walls_list, walls_np):
         if not self.alive:
             if now >= self.respawn_time:
                 self.respawn()
             return
         # Try per-axis movement with collision prevention
         # Intended new positions
-        new_x = self.pos[0] + self.vel[0]*dt
-        new_y = self.pos[1] + self.vel[1]*dt
+        x0, y0 = self.pos
+        new_x = x0 + self.vel[0]*dt
+        new_y = y0 + self.vel[1]*dt
+        moved_x = clamp(new_x, 16, WIDTH-16)
+        # one sweep over the walls for every circle the two axis moves can test:
+        # X move, Y move if X was blocked, Y move after X went through.
+        # Usually no wall is even near, and the exact test is skipped.
+        near = wall_candidates(walls_list, min(x0, new_x, moved_x), min(y0, new_y),
+                               max(x0, new_x, moved_x), max(y0, new_y), self.radius)
+        if near:
+            hit_x, hit_y_stay, hit_y_moved = circles_walls_hit(
+                np.array([new_x, x0, moved_x]), np.array([y0, new_y, new_y]), self.radius_sq, walls_np[near]).tolist()
+        else:
+            hit_x = hit_y_stay = hit_y_moved = False
         # X axis
-        collided_x = False
-        for w in walls_list:
-            if circle_rect_collision((new_x, self.pos[1]), self.radius, w):
-                collided_x = True
-                break
-        if not collided_x:
-            self.pos[0] = clamp(new_x, 16, WIDTH-16)
-        # Y axis
-        collided_y = False
-        for w in walls_list:
-            if circle_rect_collision((self.pos[0], new_y), self.radius, w):
-                collided_y = True
-                break
-        if not collided_y:
+        if not hit_x:
+            self.pos[0] = moved_x
+        # Y axis (tested from wherever X ended up)
+        if not (hit_y_stay if hit_x else hit_y_moved):
             self.pos[1] = clamp(new_y, 16, HEIGHT-16)
 
         # shield end
         if now > self.shield_active_until:
             self.shield_active_until = -1
-        # remove expired smokes
-        self.smokes = [s for s in self.smokes if s[3] > now]
+        # remove expired smokes (in place, walking from the end so pops don't shift what's left to check)
+        smokes = self.smokes
+        for i in range(len(smokes)-1, -1, -1):
+            if smokes[i][3] <= now:
+                smokes.pop(i)
         # finish reloads
         for w in self.weapons.values():
             w.finish_reload_if_needed(now)
@@ -240,7 +418,7 @@ class Player:
     def respawn(self):
         self.hp = self.max_hp
         self.alive = True
-        self.pos = [random.choice([80, WIDTH-80]), random.randint(80, HEIGHT-80)]
+        self.pos[0], self.pos[1] = random.choice([80, WIDTH-80]), random.randint(80, HEIGHT-80)
         self.shield_active_until = -1
         self.medkits = 3
 
@@ -271,16 +449,21 @@ walls = [
     pygame.Rect(900,70,40,180),
     pygame.Rect(120,470,220,40),
 ]
+walls_arr = np.array([(w.left,w.top,w.right,w.bottom) for w in walls], dtype=np.float64)  # for seg_rect_hit / circle_walls_any
 
 # Small game state
 class GameState:
     def __init__(self):
         self.player = Player(120, HEIGHT//2, color=BLUE, name="You", agent="Phoenix")
         self.bots = []
-        self.bullets = []
+        self.targets = [self.player]  # [player] + bots, kept in step by spawn_bot
+        self.bullets = BulletArrays()
         self.round_start = pygame.time.get_ticks()/1000.0
         self.round_end = self.round_start + ROUND_TIME
         self.killfeed = deque(maxlen=6)
+        self.ai_pool = None  # worker pool for bot_think, see BOT_AI_PROCESSES
+        self.ai_frame = 0
+        self.ai_pending = None  # AsyncResult of the last dispatch, applied once ready
 
     def spawn_bot(self):
         x = random.choice([WIDTH-60, 60])
@@ -288,10 +471,13 @@ class GameState:
         b = Player(x,y,color=RED,name="Bot",agent="BotAgent")
         b.kills = 0
         self.bots.append(b)
+        self.targets.append(b)
 
     def add_killfeed(self, s):
         ts = time.strftime("%H:%M:%S")
-        self.killfeed.appendleft(f"[{ts}] {s}")
+        msg = f"[{ts}] {s}"
+        # messages never change once added, so render them a single time here
+        self.killfeed.appendleft((msg, FONT.render(msg, True, WHITE)))
 
 gs = GameState()
 for _ in range(3):
@@ -300,34 +486,90 @@ for _ in range(3):
 now_time = lambda: pygame.time.get_ticks()/1000.0
 
 # AI
-def bot_ai(bot, dt, now, gs):
-    if not bot.alive:
+def bot_ai_batch(dt, now, gs):
+    # steer every bot in one vectorized pass, then only loop over the bots that fire
+    bots = gs.bots
+    if not bots:
         return
     target = gs.player
-    dirv = (target.pos[0]-bot.pos[0], target.pos[1]-bot.pos[1])
-    dist = vec_len(dirv)
-    if dist > 200:
-        nd = normalize(dirv)
-        bot.vel[0] = nd[0] * BOT_SPEED
-        bot.vel[1] = nd[1] * BOT_SPEED
+    bot_pos = np.array([b.pos for b in bots], dtype=np.float64)
+    alive = np.array([b.alive for b in bots])
+    last_shot = np.array([b.bot_last_shot for b in bots], dtype=np.float64)
+    dxy = np.asarray(target.pos, dtype=np.float64) - bot_pos
+    d2 = dist_sq(dxy[:,0], dxy[:,1])
+    d = np.sqrt(d2)
+    # unit direction to the player ((1,0) when on top of it, like atan2(0,0) == 0)
+    nd = np.where(d[:,None] > 0, dxy/np.maximum(d, 1e-12)[:,None], (1.0, 0.0))
+    far = d2 > 200*200
+    near = ~far
+    vel = np.empty_like(dxy)
+    vel[far] = nd[far]*BOT_SPEED
+    # strafe: direction rotated by +90 degrees
+    vel[near,0] = -nd[near,1]*(BOT_SPEED*0.55)
+    vel[near,1] = nd[near,0]*(BOT_SPEED*0.55)
+    for bot, v, a in zip(bots, vel.tolist(), alive.tolist()):
+        if a:
+            bot.vel[0], bot.vel[1] = v
+
+    can_shoot = alive & (d2 < 520*520) & (last_shot + 0.5 <= now)
+    for i in np.nonzero(can_shoot)[0]:
+        bot_try_fire(bots[i], i, now, gs)
+
+def bot_try_fire(bot, i, now, gs):
+    # bot i is in range and off cooldown: reload or shoot at the player
+    w = bot.weapon
+    if w.cur_mag <= 0 and w.reloading_until < now:
+        w.start_reload(now)
+    elif w.ready(now):
+        w.shoot(bot, gs.player.pos, now, gs.bullets, i + 1)  # targets are [player] + bots
+        bot.bot_last_shot = now
+
+def bot_think(state):
+    # one bot's decision from plain values only, so it can run in a worker process;
+    # same rules as bot_ai_batch. state -> (vx, vy, wants_to_shoot)
+    bx, by, alive, last_shot, px, py, now = state
+    dx, dy = px-bx, py-by
+    d2 = dist_sq(dx, dy)
+    d = math.sqrt(d2)
+    nx, ny = (dx/d, dy/d) if d > 0 else (1.0, 0.0)
+    if d2 > 200*200:
+        vx, vy = nx*BOT_SPEED, ny*BOT_SPEED
     else:
-        ang = math.atan2(dirv[1], dirv[0]) + math.pi/2
-        bot.vel[0] = math.cos(ang)*(BOT_SPEED*0.55)
-        bot.vel[1] = math.sin(ang)*(BOT_SPEED*0.55)
-
-    if dist < 520:
-        if getattr(bot,'bot_last_shot',0) + 0.5 <= now:
-            w = bot.weapon
-            if w.cur_mag <= 0 and w.reloading_until < now:
-                w.start_reload(now)
-            elif w.ready(now):
-                b = w.shoot(bot, target.pos, now)
-                if b:
-                    gs.bullets.append(b)
-                bot.bot_last_shot = now
+        vx, vy = -ny*(BOT_SPEED*0.55), nx*(BOT_SPEED*0.55)
+    return vx, vy, alive and d2 < 520*520 and last_shot + 0.5 <= now
+
+def make_ai_pool():
+    # fork only: a spawned worker would re-run this script's top level (and open a game window)
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+    return ctx.Pool(BOT_AI_PROCESSES)
+
+def bot_ai_pooled(dt, now, gs):
+    # bot_think for every bot on the worker pool without blocking the frame: a dispatch is
+    # applied on a later frame once it is ready, so bots act one dispatch late and keep their
+    # last velocity in between. Weapons and bullets stay on the main process.
+    pending = gs.ai_pending
+    if pending is not None and pending.ready():
+        gs.ai_pending = None
+        # bots are only ever appended, so dispatch order still matches gs.bots
+        for i, (bot, (vx, vy, shoot)) in enumerate(zip(gs.bots, pending.get(0))):
+            if not bot.alive:
+                continue
+            bot.vel[0], bot.vel[1] = vx, vy
+            if shoot:
+                bot_try_fire(bot, i, now, gs)
+    gs.ai_frame += 1
+    if gs.ai_pending is not None or gs.ai_frame % BOT_AI_EVERY:
+        return
+    target = gs.player
+    states = [(b.pos[0], b.pos[1], b.alive, b.bot_last_shot, target.pos[0], target.pos[1], now)
+              for b in gs.bots]
+    gs.ai_pending = gs.ai_pool.map_async(bot_think, states)
 
 # Shoot helpers
-def shoot_from(shooter, target_pos, now, gs):
+def shoot_from(shooter, target_pos, now, gs, owner_idx):
     if not shooter.alive:
         return
     w = shooter.weapon
@@ -338,19 +580,39 @@ def shoot_from(shooter, target_pos, now, gs):
         return
     if not w.ready(now):
         return
-    b = w.shoot(shooter, target_pos, now)
-    if b:
-        gs.bullets.append(b)
+    w.shoot(shooter, target_pos, now, gs.bullets, owner_idx)
 
 def handle_player_shoot(mouse_pos, now, gs):
-    shoot_from(gs.player, mouse_pos, now, gs)
-
-def bullet_hits_player(b, p):
-    if not p.alive:
-        return False
-    dx = b.pos[0]-p.pos[0]
-    dy = b.pos[1]-p.pos[1]
-    return dx*dx + dy*dy <= (p.radius)**2
+    shoot_from(gs.player, mouse_pos, now, gs, 0)
+
+HIT_CELL = 64          # broadphase grid cell (px); must be >= the largest target radius
+HIT_CELL_STRIDE = 1<<16  # packs a (cx, cy) cell into one int key; bullets never get that far off-screen
+
+def bullet_target_hits(bullets, targets):
+    # returns, per bullet, the index of the first target it overlaps or -1.
+    # broadphase: bucket the targets into a coarse grid, keep only bullets in one of the
+    # 3x3 cells around a target; narrow phase: one broadcast over those (bullet, target) pairs
+    n = bullets.n
+    out = np.full(n, -1, dtype=np.intp)
+    grid = {}
+    for ti, t in enumerate(targets):
+        grid.setdefault((int(t.pos[0]//HIT_CELL), int(t.pos[1]//HIT_CELL)), []).append(ti)
+    near_keys = np.array([(cx+dx)*HIT_CELL_STRIDE + cy+dy for cx, cy in grid
+                          for dx in (-1,0,1) for dy in (-1,0,1)], dtype=np.int64)
+    cells = np.floor_divide(bullets.pos[:n], HIT_CELL).astype(np.int64)
+    sub = np.flatnonzero(np.isin(cells[:,0]*HIT_CELL_STRIDE + cells[:,1], near_keys))
+    if not len(sub):
+        return out
+    txy = np.array([t.pos for t in targets], dtype=np.float64)
+    r2 = np.array([t.radius_sq if t.alive else -1.0 for t in targets])
+    diff = bullets.pos[sub,None,:] - txy[None,:,:]
+    d2 = (diff*diff).sum(-1)
+    rows = np.arange(len(sub))
+    d2[rows, bullets.owner[sub]] = np.inf  # bullets never hit their owner
+    hits = d2 <= r2[None,:]
+    first = np.argmax(hits, axis=1)
+    out[sub] = np.where(hits[rows, first], first, -1)
+    return out
 
 # Drawing helpers
 def draw_transparent_panel(surf, rect, color=(18,18,22,160), border=2):
@@ -358,11 +620,88 @@ def draw_transparent_panel(surf, rect, color=(18,18,22,160), border=2):
     panel.fill(color)
     surf.blit(panel, (rect.left, rect.top))
     pygame.draw.rect(surf, ACCENT, rect, border)
+    return rect
+
+# rendered draw_text surfaces, keyed by (text, colour, font) (oldest entry dropped past the cap)
+TEXT_CACHE_SIZE = 256
+_text_cache = {}
 
 def draw_text(surf, text, x, y, color=WHITE, font=FONT):
-    surf.blit(font.render(text, True, color), (x,y))
+    key = (text, color, id(font))
+    text_surf = _text_cache.get(key)
+    if text_surf is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            del _text_cache[next(iter(_text_cache))]
+        text_surf = font.render(text, True, color).convert_alpha()
+        _text_cache[key] = text_surf
+    return surf.blit(text_surf, (x,y))
+
+# pre-rendered bullet sprites (player / bot), blitted instead of drawing a circle per bullet
+def make_bullet_surf(color):
+    surf = pygame.Surface((10,10), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (5,5), 4)
+    return surf.convert_alpha()
+
+BULLET_SURF_P = make_bullet_surf(YELLOW)
+BULLET_SURF_B = make_bullet_surf(RED)
+
+# arena background (floor + walls) drawn once; each frame only the areas drawn over
+# last frame are restored from it (dirty rects) instead of clearing the whole screen
+BG_SURF = pygame.Surface((WIDTH,HEIGHT)).convert()
+BG_SURF.fill((12,14,18))
+for w in walls:
+    pygame.draw.rect(BG_SURF, GRAY, w)
+
+# static HUD text, rendered once at startup
+HINT_TEXT = FONT.render("Switch weapon: [1] Vandal  [2] Phantom  [3] Sheriff | Reload: R | Medkit: H", True, WHITE)
+KILLFEED_TITLE = BIG_FONT.render("Killfeed", True, WHITE)
+
+# fixed HUD layout, built once instead of every frame
+HUD_RECT = pygame.Rect(8, HEIGHT-118, 420, 110)
+WX, WY = 260, HEIGHT-98  # weapon box
+WEAPON_BOX = pygame.Rect(WX, WY, 140, 72)
+KX, KY = WIDTH-440, 16  # killfeed panel
+KILLFEED_RECT = pygame.Rect(KX, KY, 420, 140)
+
+# HP/ammo readouts, keyed by the values shown (oldest entry dropped past the cap)
+STAT_CACHE_SIZE = 128
+_stat_cache = {}
+
+def stat_text(label, value, maximum):
+    key = (label, value, maximum)
+    surf = _stat_cache.get(key)
+    if surf is None:
+        if len(_stat_cache) >= STAT_CACHE_SIZE:
+            del _stat_cache[next(iter(_stat_cache))]
+        surf = FONT.render(f"{label}: {value}/{maximum}", True, WHITE)
+        _stat_cache[key] = surf
+    return surf
+
+# persistent smoke overlay: allocated once, repainted only when a smoke is thrown or expires,
+# and only the area covered by smokes is blitted
+SMOKE_SURF = pygame.Surface((WIDTH,HEIGHT), pygame.SRCALPHA)
+_smoke_drawn = []   # the smokes currently painted on SMOKE_SURF
+_smoke_rect = None  # the area they cover
+
+def draw_smokes(surf, smokes):
+    # returns the area blitted (None without smokes)
+    global _smoke_rect
+    if smokes != _smoke_drawn:
+        if _smoke_rect:
+            SMOKE_SURF.fill((0,0,0,0), _smoke_rect)
+        _smoke_rect = None
+        if smokes:
+            rects = [pygame.Rect(int(s[0])-int(s[2]), int(s[1])-int(s[2]), int(s[2])*2, int(s[2])*2) for s in smokes]
+            _smoke_rect = rects[0].unionall(rects[1:]).clip(SMOKE_SURF.get_rect())
+            for s in smokes:
+                pygame.draw.circle(SMOKE_SURF, SMOKE_COLOR, (int(s[0]),int(s[1])), int(s[2]))
+        _smoke_drawn[:] = smokes
+    if _smoke_rect:
+        return surf.blit(SMOKE_SURF, _smoke_rect.topleft, area=_smoke_rect)
+    return None
 
 def draw_human(surf, pos, angle, color, name_tag=None, is_dead=False):
+    # returns the bounding rect of everything drawn
     x,y = int(pos[0]), int(pos[1])
     # body (rectangle)
     body_w, body_h = 14, 28
@@ -375,31 +714,38 @@ def draw_human(surf, pos, angle, color, name_tag=None, is_dead=False):
     leg_y = y + body_h//2
     # draw body
     bcol = (100,100,100) if is_dead else color
-    pygame.draw.rect(surf, bcol, body_rect)
-    pygame.draw.circle(surf, bcol, head_pos, head_r)
-    pygame.draw.line(surf, bcol, (x-6, leg_y), (x, leg_y+10), 3)
-    pygame.draw.line(surf, bcol, (x+6, leg_y), (x, leg_y+10), 3)
+    drawn = [pygame.draw.rect(surf, bcol, body_rect),
+             pygame.draw.circle(surf, bcol, head_pos, head_r),
+             pygame.draw.line(surf, bcol, (x-6, leg_y), (x, leg_y+10), 3),
+             pygame.draw.line(surf, bcol, (x+6, leg_y), (x, leg_y+10), 3)]
     # gun as a rotated rectangle/line extending from chest toward angle
     gun_len = 20
-    gx = x + math.cos(angle)*(body_w//2 + gun_len/2)
-    gy = y + math.sin(angle)*(0 + gun_len/2)
+    ca, sa = math.cos(angle), math.sin(angle)
     # draw gun shaft
-    ex = x + math.cos(angle)*(body_w//2 + gun_len)
-    ey = y + math.sin(angle)*(body_h//8 + gun_len)
-    pygame.draw.line(surf, (30,30,30), (x + math.cos(angle)*6, y + math.sin(angle)*6), (ex,ey), 6)
+    ex = x + ca*(body_w//2 + gun_len)
+    ey = y + sa*(body_h//8 + gun_len)
+    drawn.append(pygame.draw.line(surf, (30,30,30), (x + ca*6, y + sa*6), (ex,ey), 6))
     if name_tag:
-        draw_text(surf, name_tag, x-20, y - body_h - 18, color=WHITE)
+        drawn.append(draw_text(surf, name_tag, x-20, y - body_h - 18, color=WHITE))
+    return drawn[0].unionall(drawn[1:])
 
 # Main loop
+if BOT_AI_PROCESSES:
+    gs.ai_pool = make_ai_pool()  # created here so the workers see every function above
 running = True
 mouse_down = False
+prev_dirty = [screen.get_rect()]  # what was drawn last frame; the first frame paints everything
 
 while running:
     dt = clock.tick(60)/1000.0
     now = now_time()
     player = gs.player
 
-    for event in pygame.event.get():
+    events = pygame.event.get()
+    # input state read once per frame, right after the events are pumped
+    keys = pygame.key.get_pressed()
+    mouse_pos = pygame.mouse.get_pos()
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -407,7 +753,7 @@ while running:
                 mouse_down = True
             elif event.button == 3:
                 if player.smoke.ready(now):
-                    mx,my = pygame.mouse.get_pos()
+                    mx,my = mouse_pos
                     player.smokes.append([mx,my,120, now + 8.0])
                     player.smoke.trigger(now)
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -416,7 +762,7 @@ while running:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 if player.dash.ready(now) and player.alive:
-                    mx,my = pygame.mouse.get_pos()
+                    mx,my = mouse_pos
                     dirv = normalize((mx-player.pos[0], my-player.pos[1]))
                     dash_dist = 180
                     # dash must also respect walls: try incremental small steps to avoid teleporting inside walls
@@ -424,12 +770,8 @@ while running:
                     for s in range(1, steps+1):
                         tx = player.pos[0] + dirv[0]*dash_dist*(s/steps)
                         ty = player.pos[1] + dirv[1]*dash_dist*(s/steps)
-                        blocked = False
-                        for w in walls:
-                            if circle_rect_collision((tx, ty), player.radius, w):
-                                blocked = True
-                                break
-                        if blocked:
+                        near = wall_candidates(walls, tx, ty, tx, ty, player.radius)
+                        if near and circle_walls_any(tx, ty, player.radius_sq, walls_arr[near]):
                             # step back one and stop
                             player.pos[0] = player.pos[0] + dirv[0]*dash_dist*((s-1)/steps)
                             player.pos[1] = player.pos[1] + dirv[1]*dash_dist*((s-1)/steps)
@@ -465,78 +807,72 @@ while running:
             elif event.key == pygame.K_e:
                 # another way to throw smoke
                 if player.smoke.ready(now):
-                    mx,my = pygame.mouse.get_pos()
+                    mx,my = mouse_pos
                     player.smokes.append([mx,my,120, now + 8.0])
                     player.smoke.trigger(now)
 
     # movement
     if player.alive:
-        keys = pygame.key.get_pressed()
-        mx,my = pygame.mouse.get_pos()
+        mx,my = mouse_pos
         player.angle = math.atan2(my - player.pos[1], mx - player.pos[0])
-        vx = vy = 0
-        if keys[pygame.K_w]: vy -= 1
-        if keys[pygame.K_s]: vy += 1
-        if keys[pygame.K_a]: vx -= 1
-        if keys[pygame.K_d]: vx += 1
-        norm = normalize((vx,vy))
+        norm = _DIRS[(keys[pygame.K_d] - keys[pygame.K_a], keys[pygame.K_s] - keys[pygame.K_w])]
         player.vel[0] = norm[0]*PLAYER_SPEED
         player.vel[1] = norm[1]*PLAYER_SPEED
     else:
-        player.vel = [0,0]
+        player.vel[0] = player.vel[1] = 0.0
 
     if mouse_down:
-        handle_player_shoot(pygame.mouse.get_pos(), now, gs)
+        handle_player_shoot(mouse_pos, now, gs)
 
-    # Update player (with wall list)
-    player.update(dt, now, walls)
+    # Update player (with the walls as rects and as an array)
+    player.update(dt, now, walls, walls_arr)
 
     # Update bots
+    if gs.ai_pool is not None and len(gs.bots) >= BOT_AI_POOL_MIN_BOTS:
+        bot_ai_pooled(dt, now, gs)
+    else:
+        bot_ai_batch(dt, now, gs)
     for b in gs.bots:
-        bot_ai(b, dt, now, gs)
-        b.update(dt, now, walls)
-
-    # Update bullets: move, check seg-rect for walls, and player/bot collision
-    for b in gs.bullets[:]:
-        b.update(dt)
-        if b.is_expired(now):
-            gs.bullets.remove(b)
-            continue
-        # check if bullet segment intersects any wall
-        hit_wall = False
-        for w in walls:
-            if seg_rect_intersect(tuple(b.prev_pos), tuple(b.pos), w):
-                hit_wall = True
-                break
-        if hit_wall:
-            try: gs.bullets.remove(b)
-            except: pass
-            continue
-        # check collision with players
-        targets = [player] + gs.bots
-        hit_any = False
-        for t in targets:
-            if t is b.owner:
+        b.update(dt, now, walls, walls_arr)
+
+    # Update bullets: move all at once, then flag expired and wall-hit ones.
+    # Every removal this frame goes into `dead`; the arrays are compacted once, at the end.
+    bullets = gs.bullets
+    bullets.step(dt)
+    n = bullets.n
+    dead = now - bullets.spawn[:n] > BULLET_LIFETIME
+    dead |= seg_walls_hit(bullets.prev[:n], bullets.pos[:n], walls_arr)
+
+    # check collision with players (all bullets vs all targets at once)
+    targets = gs.targets
+    if n:
+        hit_idx = bullet_target_hits(bullets, targets)
+        hit_idx[dead] = -1  # expired / stopped by a wall: hits nobody
+        owners = bullets.owner[:n].tolist()
+        dmgs = bullets.dmg[:n].tolist()
+        for bi, ti in enumerate(hit_idx.tolist()):
+            if ti < 0:
+                continue
+            t = targets[ti]
+            if not t.alive:
+                # already killed by an earlier bullet this frame
                 continue
-            if bullet_hits_player(b, t):
-                t.take_damage(b.damage, now)
-                if not t.alive:
-                    b.owner.kills += 1
-                    b.owner.on_kill(t, now)
-                    gs.add_killfeed(f"{b.owner.name} killed {t.name}")
-                try: gs.bullets.remove(b)
-                except: pass
-                hit_any = True
-                break
-        if hit_any: continue
+            t.take_damage(dmgs[bi], now)
+            if not t.alive:
+                shooter = targets[owners[bi]]
+                shooter.kills += 1
+                shooter.on_kill(t, now)
+                gs.add_killfeed(f"{shooter.name} killed {t.name}")
+            dead[bi] = True
+    bullets.compact(~dead)
 
     # Round timer
     if now >= gs.round_end:
-        for ent in [gs.player] + gs.bots:
+        for ent in gs.targets:
             ent.alive = True
             ent.respawn_time = 0
             ent.hp = ent.max_hp
-            ent.pos = [random.randint(80, WIDTH-80), random.randint(80, HEIGHT-80)]
+            ent.pos[0], ent.pos[1] = random.randint(80, WIDTH-80), random.randint(80, HEIGHT-80)
             ent.medkits = 3
         gs.bullets.clear()
         gs.round_start = now
@@ -544,96 +880,97 @@ while running:
         gs.add_killfeed("Round reset")
 
     # --- Drawing ---
-    screen.fill((12,14,18))
-    # walls
-    for w in walls:
-        pygame.draw.rect(screen, GRAY, w)
+    # erase last frame's drawing from the background, then record every area drawn now
+    for r in prev_dirty:
+        screen.blit(BG_SURF, r, area=r)
+    dirty = []
+    add = dirty.append
 
     # smokes (player's)
-    s_surf = pygame.Surface((WIDTH,HEIGHT), pygame.SRCALPHA)
-    for s in player.smokes:
-        pygame.draw.circle(s_surf, SMOKE_COLOR, (int(s[0]),int(s[1])), int(s[2]))
-    screen.blit(s_surf, (0,0))
+    smoke_rect = draw_smokes(screen, player.smokes)
+    if smoke_rect:
+        add(smoke_rect)
 
-    # bullets
-    for b in gs.bullets:
-        col = YELLOW if b.owner is player else RED
-        pygame.draw.circle(screen, col, (int(b.pos[0]), int(b.pos[1])), 4)
+    # bullets: one batched blits() per colour instead of alternating draw calls
+    n = gs.bullets.n
+    pts = gs.bullets.pos[:n].astype(np.intp) - 5  # truncate like int(), then centre the 10x10 sprite
+    mine = gs.bullets.owner[:n] == 0
+    dirty.extend(screen.blits([(BULLET_SURF_P, p) for p in pts[mine].tolist()]))
+    dirty.extend(screen.blits([(BULLET_SURF_B, p) for p in pts[~mine].tolist()]))
 
     # draw bots as humans
     for b in gs.bots:
-        draw_human(screen, b.pos, math.atan2(gs.player.pos[1]-b.pos[1], gs.player.pos[0]-b.pos[0]), b.color, name_tag=b.name, is_dead=not b.alive)
+        add(draw_human(screen, b.pos, math.atan2(gs.player.pos[1]-b.pos[1], gs.player.pos[0]-b.pos[0]), b.color, name_tag=b.name, is_dead=not b.alive))
         if b.alive:
             # small HP bar
             hpw = int((b.hp/b.max_hp)*28)
-            pygame.draw.rect(screen, BLACK, (b.pos[0]-14, b.pos[1]-40, 28, 6))
+            add(pygame.draw.rect(screen, BLACK, (b.pos[0]-14, b.pos[1]-40, 28, 6)))
             pygame.draw.rect(screen, GREEN, (b.pos[0]-14, b.pos[1]-40, hpw, 6))
 
     # draw player as human and gun
     if player.alive:
-        draw_human(screen, player.pos, player.angle, player.color, name_tag=player.name, is_dead=False)
+        add(draw_human(screen, player.pos, player.angle, player.color, name_tag=player.name, is_dead=False))
         # HP bar bigger
         hpw = int((player.hp/player.max_hp)*200)
-        pygame.draw.rect(screen, BLACK, (16, HEIGHT-64, 204, 22))
+        add(pygame.draw.rect(screen, BLACK, (16, HEIGHT-64, 204, 22)))
         pygame.draw.rect(screen, GREEN, (18, HEIGHT-62, hpw, 18))
         pygame.draw.rect(screen, WHITE, (16, HEIGHT-64, 204, 22), 2)
 
     # HUD: transparent panel bottom-left
-    hud_rect = pygame.Rect(8, HEIGHT-118, 420, 110)
-    draw_transparent_panel(screen, hud_rect)
-    draw_text(screen, f"HP: {int(player.hp)}/{player.max_hp}", 24, HEIGHT-110)
-    draw_text(screen, f"Agent: {player.agent}", 24, HEIGHT-88)
-    draw_text(screen, f"Medkits left (H): {player.medkits}", 24, HEIGHT-66)
+    add(draw_transparent_panel(screen, HUD_RECT))
+    add(screen.blit(stat_text("HP", int(player.hp), player.max_hp), (24, HEIGHT-110)))
+    add(draw_text(screen, f"Agent: {player.agent}", 24, HEIGHT-88))
+    add(draw_text(screen, f"Medkits left (H): {player.medkits}", 24, HEIGHT-66))
     # weapon box
-    wx,wy = 260, HEIGHT-98
-    pygame.draw.rect(screen, (22,22,26,200), (wx,wy,140,72))
-    pygame.draw.rect(screen, ACCENT, (wx,wy,140,72),2)
-    draw_text(screen, f"Weapon: {player.weapon.name}", wx+8, wy+6)
-    draw_text(screen, f"Ammo: {player.weapon.cur_mag}/{player.weapon.mag}", wx+8, wy+28)
+    add(pygame.draw.rect(screen, (22,22,26,200), WEAPON_BOX))
+    pygame.draw.rect(screen, ACCENT, WEAPON_BOX, 2)
+    ui = player.weapon_ui
+    add(draw_text(screen, ui["label"], WX+8, WY+6))
+    add(screen.blit(stat_text("Ammo", player.weapon.cur_mag, player.weapon.mag), (WX+8, WY+28)))
     # ability cooldown bars
     def cooldown_bar(x,y,label,ability,width=160,height=10):
         cd = max(0, ability.cooldown - (now - ability.last))
         frac = 1 - (cd/ability.cooldown) if ability.cooldown>0 else 1
         frac = clamp(frac,0,1)
-        pygame.draw.rect(screen, (30,30,30), (x,y,width,height))
+        add(pygame.draw.rect(screen, (30,30,30), (x,y,width,height)))
         pygame.draw.rect(screen, ACCENT, (x,y,int(width*frac),height))
-        draw_text(screen, f"{label} {'Ready' if ability.ready(now) else int(cd)}s", x, y-18)
+        add(draw_text(screen, f"{label} {'Ready' if ability.ready(now) else int(cd)}s", x, y-18))
     cooldown_bar(26, HEIGHT-52, "Dash (SPACE)", player.dash)
     cooldown_bar(26, HEIGHT-36, "Shield (Q)", player.shield)
 
     # crosshair at mouse pos with spread
-    mx,my = pygame.mouse.get_pos()
-    spread_px = int(player.weapon.spread_deg*0.8)
-    # small crosshair lines
-    gap = 10 + spread_px
-    length = 8
-    pygame.draw.line(screen, WHITE, (mx-gap-length, my), (mx-gap, my), 2)
-    pygame.draw.line(screen, WHITE, (mx+gap+length, my), (mx+gap, my), 2)
-    pygame.draw.line(screen, WHITE, (mx, my-gap-length), (mx, my-gap), 2)
-    pygame.draw.line(screen, WHITE, (mx, my+gap+length), (mx, my+gap), 2)
-    pygame.draw.circle(screen, WHITE, (mx,my), 2)
+    mx,my = mouse_pos
+    # small crosshair lines, gap widened by the weapon's spread
+    gap, outer = ui["gap"], ui["outer"]
+    add(pygame.draw.line(screen, WHITE, (mx-outer, my), (mx-gap, my), 2))
+    add(pygame.draw.line(screen, WHITE, (mx+outer, my), (mx+gap, my), 2))
+    add(pygame.draw.line(screen, WHITE, (mx, my-outer), (mx, my-gap), 2))
+    add(pygame.draw.line(screen, WHITE, (mx, my+outer), (mx, my+gap), 2))
+    add(pygame.draw.circle(screen, WHITE, (mx,my), 2))
 
     # killfeed panel (top-right)
-    kx,ky = WIDTH-440, 16
-    krect = pygame.Rect(kx, ky, 420, 140)
-    pygame.draw.rect(screen, (14,14,18), krect)
-    pygame.draw.rect(screen, ACCENT, krect, 2)
-    draw_text(screen, "Killfeed", kx+10, ky+6, font=BIG_FONT)
+    add(pygame.draw.rect(screen, (14,14,18), KILLFEED_RECT))
+    pygame.draw.rect(screen, ACCENT, KILLFEED_RECT, 2)
+    add(screen.blit(KILLFEED_TITLE, (KX+10, KY+6)))
     i = 0
-    for msg in gs.killfeed:
-        draw_text(screen, msg, kx+10, ky+40 + i*18)
+    for msg, msg_surf in gs.killfeed:
+        add(screen.blit(msg_surf, (KX+10, KY+40 + i*18)))
         i+=1
 
-    draw_text(screen, f"Round ends in: {int(gs.round_end - now)}s", WIDTH//2 - 90, 12)
-    draw_text(screen, f"Kills: {player.kills}  Deaths: {player.deaths}", WIDTH//2 - 90, 36)
-    draw_text(screen, "Switch weapon: [1] Vandal  [2] Phantom  [3] Sheriff | Reload: R | Medkit: H", 18, 16)
+    add(draw_text(screen, f"Round ends in: {int(gs.round_end - now)}s", WIDTH//2 - 90, 12))
+    add(draw_text(screen, f"Kills: {player.kills}  Deaths: {player.deaths}", WIDTH//2 - 90, 36))
+    add(screen.blit(HINT_TEXT, (18, 16)))
 
     # bots scoreboard
     by = 160
     for b in gs.bots:
-        draw_text(screen, f"{b.name} K:{b.kills} D:{b.deaths} HP:{int(b.hp) if b.alive else 'DEAD'}", WIDTH-220, by)
+        add(draw_text(screen, f"{b.name} K:{b.kills} D:{b.deaths} HP:{int(b.hp) if b.alive else 'DEAD'}", WIDTH-220, by))
         by+=22
 
-    pygame.display.flip()
+    # push only the areas that changed: last frame's drawing (now erased) and this frame's
+    pygame.display.update(prev_dirty + dirty)
+    prev_dirty = dirty
 
+if gs.ai_pool is not None:
+    gs.ai_pool.terminate()
 pygame.quit()
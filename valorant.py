@@ -1,15 +1,38 @@
 # valorant.py
 # A simple 2D top-down shooter prototype inspired by Valorant mechanics.
 # Requires: pygame (pip install pygame)
+# Optional: numpy batches the bullet step and bot AI, numba on top JIT-compiles the bullet step.
+# Without numpy, or under PyPy (pypy3 valorant.py), plain lists and floats are used instead,
+# which PyPy's tracing JIT compiles well.
 
 import pygame
 import math
+import platform
 import random
+from collections import defaultdict, deque
+
+# numpy runs slowly under PyPy (C-API emulation), so PyPy always takes the plain-list path
+np = njit = None
+if platform.python_implementation() != "PyPy":
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+if np is not None:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+USE_NUMPY = np is not None
 
 pygame.init()
 WIDTH, HEIGHT = 1200, 700
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Mini-Valorant (Top-down prototype)")
+# only queue the events the main loop handles; SDL drops the rest (mouse motion above all)
+# before they are translated into pygame events
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN])
 clock = pygame.time.Clock()
 FONT = pygame.font.SysFont("consolas", 18)
 
@@ -18,11 +41,15 @@ PLAYER_SPEED = 260  # px/sec
 PLAYER_RADIUS = 14
 BULLET_SPEED = 900
 BULLET_LIFETIME = 1.2
+MAX_BULLETS = 256  # preallocated bullet slots (doubles if ever exceeded)
 FIRE_RATE = 0.18  # seconds between shots
 BOT_FIRE_RATE = 0.5
 BOT_SPEED = 160
 ROUND_TIME = 90  # seconds
 RESPAWN_DELAY = 3  # seconds
+HP_SCALE = 100  # hp is kept in integer hundredths of a point
+DAMAGE_TAKEN = (HP_SCALE, 45)  # hp lost per point of damage, indexed by Player.shielded (shield: 45%)
+HIT_CELL_SHIFT = 6  # bullet-vs-player grid cells are 64px (> 2 * PLAYER_RADIUS)
 
 # Colors
 WHITE = (245, 245, 245)
@@ -52,23 +79,153 @@ def normalize(v):
 
 
 # --- Game Objects ---
-class Bullet:
-    def __init__(self, pos, vel, owner, damage=34):
-        self.pos = list(pos)
-        self.vel = vel
-        self.owner = owner
-        self.spawn = pygame.time.get_ticks() / 1000.0
-        self.damage = damage
-
-    def update(self, dt):
-        self.pos[0] += self.vel[0] * dt
-        self.pos[1] += self.vel[1] * dt
-
-    def is_expired(self, now):
-        return now - self.spawn > BULLET_LIFETIME
+class BulletArrays:
+    # all live bullets as rows of parallel arrays, packed at the front in spawn order;
+    # `owner` is the shooter's index in `targets`
+    FIELDS = ("pos", "vel", "owner", "dmg", "spawn")
+    __slots__ = ("n",) + FIELDS
+
+    def __init__(self, cap=MAX_BULLETS):
+        self.n = 0
+        self.pos = np.zeros((cap, 2))
+        self.vel = np.zeros((cap, 2))
+        self.owner = np.zeros(cap, dtype=np.intp)
+        self.dmg = np.zeros(cap, dtype=np.int64)
+        self.spawn = np.zeros(cap)
+
+    def grow(self):
+        cap = 2 * len(self.spawn)
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros((cap,) + old.shape[1:], dtype=old.dtype)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
+    def spawn_bullet(self, pos, vel, owner_idx, now, damage=34):
+        if self.n == len(self.spawn):
+            self.grow()
+        i = self.n
+        self.pos[i] = pos
+        self.vel[i] = vel
+        self.owner[i] = owner_idx
+        self.dmg[i] = damage
+        self.spawn[i] = now
+        self.n = i + 1
+
+    def compact(self, keep):
+        # keep: bool mask over the n live rows; survivors stay packed and in order
+        idx = np.flatnonzero(keep)
+        m = len(idx)
+        if m == self.n:
+            return
+        for name in self.FIELDS:
+            a = getattr(self, name)
+            a[:m] = a[idx]
+        self.n = m
+
+    def clear(self):
+        self.n = 0
+
+    def points(self):
+        # (x, y, owner) per live bullet for drawing
+        n = self.n
+        return [(x, y, o) for (x, y), o in zip(self.pos[:n].astype(np.intp).tolist(), self.owner[:n].tolist())]
+
+
+class BulletLists:
+    # the same bullets as BulletArrays in plain lists of floats, for PyPy / no numpy
+    FIELDS = ("x", "y", "vx", "vy", "owner", "dmg", "spawn")
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for name in self.FIELDS:
+            setattr(self, name, [])
+
+    @property
+    def n(self):
+        return len(self.x)
+
+    def spawn_bullet(self, pos, vel, owner_idx, now, damage=34):
+        self.x.append(pos[0])
+        self.y.append(pos[1])
+        self.vx.append(vel[0])
+        self.vy.append(vel[1])
+        self.owner.append(owner_idx)
+        self.dmg.append(damage)
+        self.spawn.append(now)
+
+    def compact(self, keep):
+        # keep: bool per bullet; survivors stay in order
+        if all(keep):
+            return
+        for name in self.FIELDS:
+            a = getattr(self, name)
+            a[:] = [v for v, k in zip(a, keep) if k]
+
+    def clear(self):
+        for name in self.FIELDS:
+            del getattr(self, name)[:]
+
+    def points(self):
+        return [(int(x), int(y), o) for x, y, o in zip(self.x, self.y, self.owner)]
+
+
+# One frame of bullet physics over the n live rows: move, then expire by age, then stop
+# in a wall (half-open like Rect.collidepoint), then hit the first alive non-owner target
+# in range. Returns per bullet -1 (flies on), -2 (gone) or the index of the target hit.
+# walls: (W,4) int32 rows of left, top, right, bottom.
+if njit is not None:
+
+    @njit(cache=True)
+    def step_bullets(pos, vel, spawn, owner, n, tpos, tr2, talive, walls, dt, now):
+        out = np.full(n, -1, np.int64)
+        for i in range(n):
+            x = pos[i, 0] + vel[i, 0] * dt
+            y = pos[i, 1] + vel[i, 1] * dt
+            pos[i, 0] = x
+            pos[i, 1] = y
+            if now - spawn[i] > BULLET_LIFETIME:
+                out[i] = -2
+                continue
+            for w in range(walls.shape[0]):
+                if walls[w, 0] <= x < walls[w, 2] and walls[w, 1] <= y < walls[w, 3]:
+                    out[i] = -2
+                    break
+            if out[i] == -2:
+                continue
+            for k in range(tpos.shape[0]):
+                if k == owner[i] or not talive[k]:
+                    continue
+                dx = x - tpos[k, 0]
+                dy = y - tpos[k, 1]
+                if dx * dx + dy * dy <= tr2[k]:
+                    out[i] = k
+                    break
+        return out
+
+else:
+
+    def step_bullets(pos, vel, spawn, owner, n, tpos, tr2, talive, walls, dt, now):
+        # same result with whole-array NumPy ops
+        p = pos[:n]
+        p += vel[:n] * dt
+        gone = now - spawn[:n] > BULLET_LIFETIME
+        gone |= (
+            (p[:, None, 0] >= walls[:, 0]) & (p[:, None, 0] < walls[:, 2])
+            & (p[:, None, 1] >= walls[:, 1]) & (p[:, None, 1] < walls[:, 3])
+        ).any(axis=1)
+        d2 = ((p[:, None, :] - tpos[None, :, :]) ** 2).sum(axis=2)
+        can = (d2 <= tr2) & talive
+        can[np.arange(n), owner[:n]] = False  # bullets never hit their owner
+        can[gone] = False
+        out = np.where(can.any(axis=1), can.argmax(axis=1), -1)
+        out[gone] = -2
+        return out
 
 
 class Ability:
+    __slots__ = ("name", "cooldown", "last")
+
     def __init__(self, name, cooldown):
         self.name = name
         self.cooldown = cooldown
@@ -82,14 +239,20 @@ class Ability:
 
 
 class Player:
-    def __init__(self, x, y, color=BLUE, name="Player"):
+    __slots__ = ("idx", "pos", "vel", "color", "angle", "hp", "max_hp", "radius", "radius_sq", "fire_cooldown",
+                 "name", "kills", "deaths", "alive", "respawn_time", "dash", "smoke", "shield",
+                 "shield_active_until", "shielded", "smokes", "bot_last_shot")
+
+    def __init__(self, x, y, color=BLUE, name="Player", idx=0):
+        self.idx = idx  # position in `targets`, stored as the owner of this player's bullets
         self.pos = [x, y]
         self.vel = [0, 0]
         self.color = color
         self.angle = 0
-        self.hp = 100
-        self.max_hp = 100
+        self.hp = 100 * HP_SCALE
+        self.max_hp = 100 * HP_SCALE
         self.radius = PLAYER_RADIUS
+        self.radius_sq = PLAYER_RADIUS * PLAYER_RADIUS  # keep in step with radius
         self.fire_cooldown = 0
         self.name = name
         self.kills = 0
@@ -101,7 +264,9 @@ class Player:
         self.smoke = Ability("Smoke", 12.0)
         self.shield = Ability("Shield", 15.0)
         self.shield_active_until = -1
-        self.smokes = []  # active smoke circles (x,y,r,expiry)
+        self.shielded = False  # shield_active_until > now, as of the last update
+        self.smokes = deque()  # active smoke circles (x,y,r,expiry), oldest first
+        self.bot_last_shot = 0  # only used when a bot AI drives this player
 
     def update(self, dt, now):
         if not self.alive:
@@ -119,8 +284,11 @@ class Player:
         # shield duration check
         if now > self.shield_active_until:
             self.shield_active_until = -1
-        # remove expired smokes
-        self.smokes = [s for s in self.smokes if s[3] > now]
+        self.shielded = self.shield_active_until > now
+        # remove expired smokes; they all last as long, so expiry follows cast order
+        smokes = self.smokes
+        while smokes and smokes[0][3] <= now:
+            smokes.popleft()
 
     def respawn(self):
         self.hp = self.max_hp
@@ -128,11 +296,10 @@ class Player:
         # place in random spawn area
         self.pos = [random.choice([80, WIDTH - 80]), random.randint(80, HEIGHT - 80)]
         self.shield_active_until = -1
+        self.shielded = False
 
     def take_damage(self, dmg, now):
-        if self.shield_active_until > now:
-            dmg = dmg * 0.45  # shield reduces damage
-        self.hp -= dmg
+        self.hp -= dmg * DAMAGE_TAKEN[self.shielded]  # shield reduces damage
         if self.hp <= 0 and self.alive:
             self.die(now)
 
@@ -149,20 +316,25 @@ walls = [
     pygame.Rect(900, 70, 40, 180),
     pygame.Rect(120, 470, 220, 40),
 ]
+wall_bounds = [(w.left, w.top, w.right, w.bottom) for w in walls]
+if USE_NUMPY:
+    walls_arr = np.array(wall_bounds, dtype=np.int32)
 
 # Game state
 player = Player(120, HEIGHT // 2, color=BLUE, name="You")
 bots = []
-bullets = []
+targets = [player]  # [player] + bots, kept in step by spawn_bot
+bullets = BulletArrays() if USE_NUMPY else BulletLists()
 now_time = lambda: pygame.time.get_ticks() / 1000.0
 
 
 def spawn_bot():
     x = random.choice([WIDTH - 60, 60])
     y = random.randint(60, HEIGHT - 60)
-    b = Player(x, y, color=RED, name="Bot")
+    b = Player(x, y, color=RED, name="Bot", idx=len(targets))
     b.kills = 0
     bots.append(b)
+    targets.append(b)
 
 
 for _ in range(3):
@@ -173,27 +345,147 @@ round_end = round_start + ROUND_TIME
 
 
 # AI simple behavior
-def bot_ai(bot, dt, now):
-    if not bot.alive:
+def bot_ai_batch(dt, now):
+    # steer every bot in one vectorized pass, then only loop over the bots that fire
+    if not bots:
         return
     target = player
-    dirv = (target.pos[0] - bot.pos[0], target.pos[1] - bot.pos[1])
-    dist = vec_len(dirv)
-    if dist > 200:
-        nd = normalize(dirv)
-        bot.vel[0] = nd[0] * BOT_SPEED
-        bot.vel[1] = nd[1] * BOT_SPEED
-    else:
-        ang = math.atan2(dirv[1], dirv[0]) + math.pi / 2
-        bot.vel[0] = math.cos(ang) * (BOT_SPEED * 0.55)
-        bot.vel[1] = math.sin(ang) * (BOT_SPEED * 0.55)
-
-    if dist < 520:
-        if getattr(bot, "bot_last_shot", 0) + BOT_FIRE_RATE <= now:
+    bot_pos = np.array([b.pos for b in bots], dtype=np.float64)
+    alive = np.array([b.alive for b in bots])
+    last_shot = np.array([b.bot_last_shot for b in bots], dtype=np.float64)
+    dxy = np.asarray(target.pos, dtype=np.float64) - bot_pos
+    d2 = dxy[:, 0] * dxy[:, 0] + dxy[:, 1] * dxy[:, 1]
+    d = np.sqrt(d2)
+    # unit direction to the player ((1,0) when on top of it, like atan2(0,0) == 0)
+    nd = np.where(d[:, None] > 0, dxy / np.maximum(d, 1e-12)[:, None], (1.0, 0.0))
+    far = d2 > 200 * 200
+    near = ~far
+    vel = np.empty_like(dxy)
+    vel[far] = nd[far] * BOT_SPEED
+    # strafe: direction rotated by +90 degrees
+    vel[near, 0] = -nd[near, 1] * (BOT_SPEED * 0.55)
+    vel[near, 1] = nd[near, 0] * (BOT_SPEED * 0.55)
+    for bot, v, a in zip(bots, vel.tolist(), alive.tolist()):
+        if a:
+            bot.vel[0], bot.vel[1] = v
+
+    can_shoot = alive & (d2 < 520 * 520) & (last_shot + BOT_FIRE_RATE <= now)
+    for i in np.flatnonzero(can_shoot).tolist():
+        bot = bots[i]
+        shoot_from(bot, target.pos, now, spread=6)
+        bot.bot_last_shot = now
+
+
+def bot_ai_loop(dt, now):
+    # bot_ai_batch one bot at a time, on plain floats
+    target = player
+    tx, ty = target.pos
+    for bot in bots:
+        if not bot.alive:
+            continue
+        dx = tx - bot.pos[0]
+        dy = ty - bot.pos[1]
+        d2 = dx * dx + dy * dy
+        if d2 > 0:
+            inv = 1.0 / math.sqrt(d2)
+            nx, ny = dx * inv, dy * inv
+        else:
+            nx, ny = 1.0, 0.0
+        if d2 > 200 * 200:
+            bot.vel[0] = nx * BOT_SPEED
+            bot.vel[1] = ny * BOT_SPEED
+        else:
+            bot.vel[0] = -ny * (BOT_SPEED * 0.55)
+            bot.vel[1] = nx * (BOT_SPEED * 0.55)
+        if d2 < 520 * 520 and bot.bot_last_shot + BOT_FIRE_RATE <= now:
             shoot_from(bot, target.pos, now, spread=6)
             bot.bot_last_shot = now
 
 
+def update_bullets_batch(dt, now):
+    # move every bullet in step_bullets, then apply the hits it reports
+    n = bullets.n
+    if not n:
+        return
+    tpos = np.array([t.pos for t in targets], dtype=np.float64)
+    tr2 = np.array([t.radius_sq for t in targets], dtype=np.float64)
+    talive = np.array([t.alive for t in targets])
+    hits = step_bullets(
+        bullets.pos, bullets.vel, bullets.spawn, bullets.owner, n, tpos, tr2, talive, walls_arr, dt, now
+    )
+    keep = hits == -1
+    owners = bullets.owner[:n].tolist()
+    dmgs = bullets.dmg[:n].tolist()
+    for i in np.flatnonzero(hits >= 0).tolist():
+        t = targets[hits[i]]
+        if not t.alive:
+            # killed by an earlier bullet this frame: this one flies on
+            keep[i] = True
+            continue
+        t.take_damage(dmgs[i], now)
+        if not t.alive:
+            targets[owners[i]].kills += 1
+    bullets.compact(keep)
+
+
+def build_hit_grid(targets):
+    # hash every alive target into each grid cell its circle overlaps,
+    # so a bullet only has to check the targets listed for its own cell
+    grid = defaultdict(list)
+    for t in targets:
+        if not t.alive:
+            continue
+        x, y, r = t.pos[0], t.pos[1], t.radius
+        for cx in range(int(x - r) >> HIT_CELL_SHIFT, (int(x + r) >> HIT_CELL_SHIFT) + 1):
+            for cy in range(int(y - r) >> HIT_CELL_SHIFT, (int(y + r) >> HIT_CELL_SHIFT) + 1):
+                grid[(cx, cy)].append(t)
+    return grid
+
+
+def update_bullets_loop(dt, now):
+    # step_bullets and the hit handling fused into one loop over plain lists
+    b = bullets
+    n = b.n
+    if not n:
+        return
+    xs, ys, vxs, vys, owners = b.x, b.y, b.vx, b.vy, b.owner
+    grid = build_hit_grid(targets)
+    keep = [True] * n
+    for i in range(n):
+        x = xs[i] + vxs[i] * dt
+        y = ys[i] + vys[i] * dt
+        xs[i] = x
+        ys[i] = y
+        if now - b.spawn[i] > BULLET_LIFETIME:
+            keep[i] = False
+            continue
+        for l, t, r, btm in wall_bounds:
+            if l <= x < r and t <= y < btm:
+                keep[i] = False
+                break
+        if not keep[i]:
+            continue
+        owner = owners[i]
+        for t in grid.get((int(x) >> HIT_CELL_SHIFT, int(y) >> HIT_CELL_SHIFT), ()):
+            if t.idx == owner or not t.alive:  # alive: may have died to an earlier bullet this frame
+                continue
+            dx = x - t.pos[0]
+            dy = y - t.pos[1]
+            if dx * dx + dy * dy <= t.radius_sq:
+                t.take_damage(b.dmg[i], now)
+                if not t.alive:
+                    targets[owner].kills += 1
+                keep[i] = False
+                break
+    b.compact(keep)
+
+
+if USE_NUMPY:
+    bot_ai, update_bullets = bot_ai_batch, update_bullets_batch
+else:
+    bot_ai, update_bullets = bot_ai_loop, update_bullets_loop
+
+
 def shoot_from(shooter, target_pos, now, spread=3):
     if not shooter.alive:
         return
@@ -201,11 +493,10 @@ def shoot_from(shooter, target_pos, now, spread=3):
         return
     dx = target_pos[0] - shooter.pos[0]
     dy = target_pos[1] - shooter.pos[1]
-    base = normalize((dx, dy))
-    angle = math.atan2(base[1], base[0])
+    angle = math.atan2(dy, dx)  # scale-free, so no need to normalize first
     angle += math.radians(random.uniform(-spread, spread))
     vel = (math.cos(angle) * BULLET_SPEED, math.sin(angle) * BULLET_SPEED)
-    bullets.append(Bullet(shooter.pos[:], vel, shooter))
+    bullets.spawn_bullet(shooter.pos, vel, shooter.idx, now)
     shooter.fire_cooldown = FIRE_RATE
 
 
@@ -217,34 +508,65 @@ def handle_player_shoot(mouse_pos, now):
     shoot_from(player, mouse_pos, now, spread=2)
 
 
-def bullet_hits_wall(b):
-    for w in walls:
-        if w.collidepoint(b.pos[0], b.pos[1]):
-            return True
-    return False
+# persistent smoke overlay: allocated once, repainted only when a smoke is thrown or expires,
+# and only the area covered by smokes is blitted
+SMOKE_SURF = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+_smoke_drawn = deque()  # the smokes currently painted on SMOKE_SURF
+_smoke_rect = None  # the area they cover
+
 
+def draw_smokes(surf, smokes):
+    # returns the area blitted (None without smokes)
+    global _smoke_rect
+    if smokes != _smoke_drawn:
+        if _smoke_rect:
+            SMOKE_SURF.fill((0, 0, 0, 0), _smoke_rect)
+        _smoke_rect = None
+        if smokes:
+            rects = [pygame.Rect(int(s[0]) - int(s[2]), int(s[1]) - int(s[2]), int(s[2]) * 2, int(s[2]) * 2) for s in smokes]
+            _smoke_rect = rects[0].unionall(rects[1:]).clip(SMOKE_SURF.get_rect())
+            for s in smokes:
+                pygame.draw.circle(SMOKE_SURF, SMOKE_COLOR, (int(s[0]), int(s[1])), int(s[2]))
+        _smoke_drawn.clear()
+        _smoke_drawn.extend(smokes)
+    if _smoke_rect:
+        return surf.blit(SMOKE_SURF, _smoke_rect.topleft, area=_smoke_rect)
+    return None
 
-def bullet_hits_player(b, p, now):
-    if not p.alive:
-        return False
-    dx = b.pos[0] - p.pos[0]
-    dy = b.pos[1] - p.pos[1]
-    return dx * dx + dy * dy <= (p.radius) ** 2
+
+# rendered draw_text surfaces, keyed by (text, colour) (oldest entry dropped past the cap)
+TEXT_CACHE_SIZE = 256
+_text_cache = {}
 
 
 def draw_text(surf, text, x, y, color=WHITE):
-    surf.blit(FONT.render(text, True, color), (x, y))
+    key = (text, color)
+    text_surf = _text_cache.get(key)
+    if text_surf is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            del _text_cache[next(iter(_text_cache))]
+        text_surf = FONT.render(text, True, color).convert_alpha()
+        _text_cache[key] = text_surf
+    return surf.blit(text_surf, (x, y))
 
 
-# Main loop
-running = True
-mouse_down = False
+# arena background (floor + walls) drawn once; each frame only the areas drawn over
+# last frame are restored from it (dirty rects) instead of clearing the whole screen
+BG_SURF = pygame.Surface((WIDTH, HEIGHT)).convert()
+BG_SURF.fill((20, 20, 30))
+for w in walls:
+    pygame.draw.rect(BG_SURF, GRAY, w)
 
-while running:
-    dt = clock.tick(60) / 1000.0
-    now = now_time()
 
-    for event in pygame.event.get():
+# Main loop
+def frame(dt, now):
+    # one frame of input, simulation and drawing; a function rather than the loop body so
+    # its names are fast locals (and PyPy traces it as one unit). Returns False on quit.
+    global mouse_down, round_start, round_end, prev_dirty
+    running = True
+    events = pygame.event.get()
+    mx, my = mouse_pos = pygame.mouse.get_pos()  # once per frame, after the queue is pumped
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -252,7 +574,6 @@ while running:
                 mouse_down = True
             elif event.button == 3:
                 if player.smoke.ready(now):
-                    mx, my = pygame.mouse.get_pos()
                     player.smokes.append([mx, my, 120, now + 8.0])
                     player.smoke.trigger(now)
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -261,7 +582,6 @@ while running:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 if player.dash.ready(now) and player.alive:
-                    mx, my = pygame.mouse.get_pos()
                     dirv = normalize((mx - player.pos[0], my - player.pos[1]))
                     dash_dist = 180
                     player.pos[0] += dirv[0] * dash_dist
@@ -278,7 +598,6 @@ while running:
     # keyboard movement
     if player.alive:
         keys = pygame.key.get_pressed()
-        mx, my = pygame.mouse.get_pos()
         player.angle = math.atan2(my - player.pos[1], mx - player.pos[0])
         vx = vy = 0
         if keys[pygame.K_w]:
@@ -296,35 +615,18 @@ while running:
         player.vel = [0, 0]
 
     if mouse_down:
-        handle_player_shoot(pygame.mouse.get_pos(), now)
+        handle_player_shoot(mouse_pos, now)
 
     player.update(dt, now)
 
+    bot_ai(dt, now)
     for b in bots:
-        bot_ai(b, dt, now)
         b.update(dt, now)
 
-    for b in bullets[:]:
-        b.update(dt)
-        if b.is_expired(now) or bullet_hits_wall(b):
-            bullets.remove(b)
-            continue
-        targets = [player] + bots
-        for t in targets:
-            if t is b.owner:
-                continue
-            if bullet_hits_player(b, t, now):
-                t.take_damage(b.damage, now)
-                if not t.alive:
-                    b.owner.kills += 1
-                try:
-                    bullets.remove(b)
-                except ValueError:
-                    pass
-                break
+    update_bullets(dt, now)
 
     if now >= round_end:
-        for ent in [player] + bots:
+        for ent in targets:
             ent.alive = True
             ent.respawn_time = 0
             ent.hp = ent.max_hp
@@ -334,62 +636,79 @@ while running:
         round_end = round_start + ROUND_TIME
 
     # --- Drawing ---
-    screen.fill((20, 20, 30))
-    for w in walls:
-        pygame.draw.rect(screen, GRAY, w)
+    # erase last frame's drawing from the background, then record every area drawn now
+    for r in prev_dirty:
+        screen.blit(BG_SURF, r, area=r)
+    dirty = []
+    add = dirty.append
 
-    surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    for s in player.smokes:
-        pygame.draw.circle(surf, SMOKE_COLOR, (int(s[0]), int(s[1])), int(s[2]))
-    screen.blit(surf, (0, 0))
+    smoke_rect = draw_smokes(screen, player.smokes)
+    if smoke_rect:
+        add(smoke_rect)
 
-    for b in bullets:
-        pygame.draw.circle(screen, YELLOW if b.owner is player else RED, (int(b.pos[0]), int(b.pos[1])), 4)
+    for bx, by, o in bullets.points():
+        add(pygame.draw.circle(screen, YELLOW if o == 0 else RED, (bx, by), 4))
 
     for b in bots:
         if b.alive:
-            pygame.draw.circle(screen, b.color, (int(b.pos[0]), int(b.pos[1])), b.radius)
+            add(pygame.draw.circle(screen, b.color, (int(b.pos[0]), int(b.pos[1])), b.radius))
             hpw = int((b.hp / b.max_hp) * (b.radius * 2))
-            pygame.draw.rect(screen, BLACK, (b.pos[0] - b.radius, b.pos[1] - b.radius - 8, b.radius * 2, 6))
+            add(pygame.draw.rect(screen, BLACK, (b.pos[0] - b.radius, b.pos[1] - b.radius - 8, b.radius * 2, 6)))
             pygame.draw.rect(screen, GREEN, (b.pos[0] - b.radius, b.pos[1] - b.radius - 8, hpw, 6))
 
     if player.alive:
-        pygame.draw.circle(screen, player.color, (int(player.pos[0]), int(player.pos[1])), player.radius)
+        add(pygame.draw.circle(screen, player.color, (int(player.pos[0]), int(player.pos[1])), player.radius))
         muzzle = (
             player.pos[0] + math.cos(player.angle) * player.radius * 1.6,
             player.pos[1] + math.sin(player.angle) * player.radius * 1.6,
         )
-        pygame.draw.line(screen, WHITE, player.pos, muzzle, 3)
+        add(pygame.draw.line(screen, WHITE, player.pos, muzzle, 3))
         if player.shield_active_until > now:
             a = int(120 * (player.shield_active_until - now) / 4.0)
-            pygame.draw.circle(
+            add(pygame.draw.circle(
                 screen,
                 (180, 220, 255, a),
                 (int(player.pos[0]), int(player.pos[1])),
                 int(player.radius * 1.8),
                 2,
-            )
+            ))
         hpw = int((player.hp / player.max_hp) * 80)
-        pygame.draw.rect(screen, BLACK, (10, HEIGHT - 38, 84, 16))
+        add(pygame.draw.rect(screen, BLACK, (10, HEIGHT - 38, 84, 16)))
         pygame.draw.rect(screen, GREEN, (12, HEIGHT - 36, hpw, 12))
 
-    draw_text(screen, f"HP: {int(player.hp)}  Kills: {player.kills}  Deaths: {player.deaths}", 10, HEIGHT - 66)
-    draw_text(screen, f"Round ends in: {int(round_end - now)}s", WIDTH - 220, 10)
+    add(draw_text(screen, f"HP: {int(player.hp / HP_SCALE)}  Kills: {player.kills}  Deaths: {player.deaths}", 10, HEIGHT - 66))
+    add(draw_text(screen, f"Round ends in: {int(round_end - now)}s", WIDTH - 220, 10))
     cd_dash = max(0, round(player.dash.cooldown - (now - player.dash.last), 1)) if not player.dash.ready(now) else 0
-    draw_text(screen, f"[SPACE] Dash cd: {cd_dash if cd_dash>0 else 'Ready'}", 10, 10)
-    draw_text(
+    add(draw_text(screen, f"[SPACE] Dash cd: {cd_dash if cd_dash>0 else 'Ready'}", 10, 10))
+    add(draw_text(
         screen, f"[RMB] Smoke cd: {int(max(0, player.smoke.cooldown - (now - player.smoke.last)))}", 10, 30
-    )
-    draw_text(
+    ))
+    add(draw_text(
         screen, f"[Q] Shield cd: {int(max(0, player.shield.cooldown - (now - player.shield.last)))}", 10, 50
-    )
-    draw_text(screen, "Shoot: LMB | Dash: SPACE | Smoke: RMB | Shield: Q", WIDTH // 2 - 180, HEIGHT - 30)
+    ))
+    add(draw_text(screen, "Shoot: LMB | Dash: SPACE | Smoke: RMB | Shield: Q", WIDTH // 2 - 180, HEIGHT - 30))
 
     y = 10
     for b in bots:
-        draw_text(screen, f"{b.name} K:{b.kills} D:{b.deaths} HP:{int(b.hp) if b.alive else 'DEAD'}", WIDTH - 260, y)
+        add(draw_text(screen, f"{b.name} K:{b.kills} D:{b.deaths} HP:{int(b.hp / HP_SCALE) if b.alive else 'DEAD'}", WIDTH - 260, y))
         y += 20
 
-    pygame.display.flip()
+    # push only the areas that changed: last frame's drawing (now erased) and this frame's
+    pygame.display.update(prev_dirty + dirty)
+    prev_dirty = dirty
+    return running
+
+
+mouse_down = False
+prev_dirty = [screen.get_rect()]  # what was drawn last frame; the first frame paints everything
+running = True
+# the game clock advances by what clock.tick reports (ms since the previous tick), so each
+# frame gets its time from the tick it already makes instead of a second get_ticks() call
+clock.tick()
+ticks = pygame.time.get_ticks()
+while running:
+    ms = clock.tick(60)
+    ticks += ms
+    running = frame(ms / 1000.0, ticks / 1000.0)
 
 pygame.quit()
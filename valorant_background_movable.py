@@ -24,6 +24,9 @@ WALL_COLOR = (80, 80, 80, 200)
 pygame.init()
 screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
 pygame.display.set_caption("Mini Valorant Exploration (Pygame)")
+# only queue the events the main loop handles; SDL drops the rest (mouse motion above all)
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Consolas", 18)
 
@@ -31,6 +34,56 @@ font = pygame.font.SysFont("Consolas", 18)
 def clamp(v, a, b):
     return max(a, min(b, v))
 
+# -------- QUADTREE ----------
+class QuadTree:
+    # static spatial index over rects; a rect is stored in every leaf it overlaps
+    MAX_ITEMS = 4
+    MAX_DEPTH = 6
+
+    def __init__(self, bounds, depth=0):
+        self.bounds = bounds
+        self.depth = depth
+        self.children = None
+        self.items = []
+
+    def insert(self, rect):
+        if not self.bounds.colliderect(rect):
+            return
+        if self.children is not None:
+            for c in self.children:
+                c.insert(rect)
+            return
+        self.items.append(rect)
+        if len(self.items) > self.MAX_ITEMS and self.depth < self.MAX_DEPTH:
+            self.split()
+
+    def split(self):
+        x, y, w, h = self.bounds
+        hw, hh = w // 2, h // 2
+        self.children = [
+            QuadTree(pygame.Rect(x, y, hw, hh), self.depth + 1),
+            QuadTree(pygame.Rect(x + hw, y, w - hw, hh), self.depth + 1),
+            QuadTree(pygame.Rect(x, y + hh, hw, h - hh), self.depth + 1),
+            QuadTree(pygame.Rect(x + hw, y + hh, w - hw, h - hh), self.depth + 1),
+        ]
+        items, self.items = self.items, []
+        for r in items:
+            for c in self.children:
+                c.insert(r)
+
+    def query(self, rect, out=None):
+        # candidate rects from the leaves rect overlaps (may repeat across leaves)
+        if out is None:
+            out = []
+        if not self.bounds.colliderect(rect):
+            return out
+        if self.children is None:
+            out.extend(self.items)
+        else:
+            for c in self.children:
+                c.query(rect, out)
+        return out
+
 # -------- CAMERA ----------
 class Camera:
     def __init__(self, w, h):
@@ -65,6 +118,57 @@ for _ in range(120):
 start_rect = pygame.Rect(0, 0, 600, 600)
 walls = [r for r in walls if not r.colliderect(start_rect)]
 
+# walls never move, so index them once
+wall_tree = QuadTree(pygame.Rect(0, 0, WORLD_W, WORLD_H))
+for w in walls:
+    wall_tree.insert(w)
+
+# -------- BACKGROUND LAYERS ----------
+# Layer content is fixed in "parallax space" (world coords * factor); a layer point lands on
+# screen at its parallax-space position plus layer_offset(), so each layer is laid out once.
+def layer_offset(par):
+    ox = (1 - par) * (SCREEN_W/2) - camera.x * par
+    oy = (1 - par) * (SCREEN_H/2) - camera.y * par
+    return ox, oy
+
+# far layer: clouds on a grid; positions and pulse phases fixed, only the radius animates,
+# so each cloud is a blit of a pre-drawn circle of the current radius
+CLOUD_RADIUS = 60
+CLOUD_SPACING = 800
+clouds = []
+par = PARALLAX_FACTORS[0]
+for cx in range(-CLOUD_SPACING, WORLD_W + CLOUD_SPACING, CLOUD_SPACING):
+    for cy in range(-CLOUD_SPACING//2, WORLD_H + CLOUD_SPACING, CLOUD_SPACING):
+        clouds.append(((cx + 120 * math.sin(cx+cy*0.01)) * par, (cy + 70*math.cos(cx*0.005)) * par, cx*0.001))
+cloud_sprites = {}
+for r in range(int(CLOUD_RADIUS*0.4), int(CLOUD_RADIUS*1.2) + 1):  # every radius the pulse reaches
+    surf = pygame.Surface((2*r, 2*r), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (245,245,255), (r, r), r)
+    cloud_sprites[r] = surf.convert_alpha()
+
+# mid layer: static tiles rendered once to one surface, blitted (clipped) each frame
+TILE = 120
+par = PARALLAX_FACTORS[1]
+tile_px = int(TILE*par)
+tile_margin = tile_px // 2  # tiles are centred on their grid point, so they hang over the origin
+mid_layer = pygame.Surface((int(WORLD_W*par) + tile_px, int(WORLD_H*par) + tile_px), pygame.SRCALPHA)
+for tx in range(0, WORLD_W, TILE):
+    for ty in range(0, WORLD_H, TILE):
+        # integer grid: int(tx*par) rounds some multiples down (360*0.7 -> 251) and opens 1px seams
+        pygame.draw.rect(mid_layer, (35, 95, 45), ((tx//TILE)*tile_px, (ty//TILE)*tile_px, tile_px, tile_px))
+mid_layer = mid_layer.convert_alpha()
+
+# minimap wall layer: walls never move, so draw them once
+mini_w, mini_h = 240, 160
+scale_x = mini_w / WORLD_W
+scale_y = mini_h / WORLD_H
+minimap_walls = pygame.Surface((mini_w, mini_h)).convert()
+minimap_walls.fill((20, 20, 20))
+for w in walls:
+    r = pygame.Rect(int(w.x * scale_x), int(w.y * scale_y), int(w.width * scale_x), int(w.height * scale_y))
+    pygame.draw.rect(minimap_walls, (120,120,120), r)
+minimap = pygame.Surface((mini_w, mini_h)).convert()
+
 # -------- PLAYER ----------
 player = {
     "x": 300.0,
@@ -79,23 +183,26 @@ bullets = []
 
 # helper to check collision with walls
 def collides_walls(rect):
-    for w in walls:
-        if rect.colliderect(w):
-            return True
-    return False
+    return rect.collidelist(wall_tree.query(rect)) != -1
 
 # -------- MAIN LOOP ----------
 running = True
+# time since start, advanced by clock.tick's own elapsed ms rather than a get_ticks() per frame
+clock.tick()
+ticks = pygame.time.get_ticks()
 while running:
-    dt = clock.tick(FPS) / 1000.0
+    ms = clock.tick(FPS)
+    ticks += ms
+    dt = ms / 1000.0
 
     # --- EVENTS ---
-    for event in pygame.event.get():
+    events = pygame.event.get()
+    mx, my = pygame.mouse.get_pos()  # once per frame, after the queue is pumped
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # shoot bullet towards mouse world pos
-            mx, my = pygame.mouse.get_pos()
             # convert mouse screen -> world (approx)
             wx = camera.x + mx
             wy = camera.y + my
@@ -149,25 +256,24 @@ while running:
         # else blocked, stay
 
     # update player angle to face mouse world pos
-    mx, my = pygame.mouse.get_pos()
     world_mx = camera.x + mx
     world_my = camera.y + my
     player["angle"] = math.degrees(math.atan2(world_my - player["y"], world_mx - player["x"]))
 
-    # update bullets
-    for b in bullets[:]:
+    # update bullets, compacting survivors to the front in one pass (no list.remove)
+    keep = 0
+    for b in bullets:
         b["x"] += b["vx"] * dt
         b["y"] += b["vy"] * dt
         b["life"] -= dt
         br = pygame.Rect(b["x"]-3, b["y"]-3, 6, 6)
         # bullet vs walls
-        hit = False
-        for w in walls:
-            if br.colliderect(w):
-                hit = True
-                break
+        hit = collides_walls(br)
         if hit or b["life"] <= 0 or b["x"] < 0 or b["x"] > WORLD_W or b["y"] < 0 or b["y"] > WORLD_H:
-            bullets.remove(b)
+            continue
+        bullets[keep] = b
+        keep += 1
+    del bullets[keep:]
 
     # update camera to follow player (centered) with clamping
     camera.update(player["x"], player["y"])
@@ -176,54 +282,55 @@ while running:
     screen.fill(SKY)
 
     # far layer: clouds (parallax factor 0.4)
-    par = PARALLAX_FACTORS[0]
-    # draw simple random "cloud" blobs as circles spaced across the world
-    cloud_radius = 60
-    # we'll draw clouds on a grid so they repeat uniformly
-    cloud_spacing = 800
-    start_cx = -cloud_spacing
-    for cx in range(start_cx, WORLD_W + cloud_spacing, cloud_spacing):
-        for cy in range(-cloud_spacing//2, WORLD_H + cloud_spacing, cloud_spacing):
-            sx, sy = camera.world_to_screen(cx + 120 * math.sin(cx+cy*0.01), cy + 70*math.cos(cx*0.005), parallax=par)
-            pygame.draw.circle(screen, (245,245,255), (sx, sy), int(cloud_radius * (0.8 + 0.4*math.sin(cx*0.001+pygame.time.get_ticks()*0.0005))))
-
-    # mid layer: repeated mountains/tiles (parallax 0.7)
-    par = PARALLAX_FACTORS[1]
-    tile = 120
-    for tx in range(0, WORLD_W, tile):
-        for ty in range(0, WORLD_H, tile):
-            sx, sy = camera.world_to_screen(tx, ty, parallax=par)
-            # draw small tiles / decorative mountains as rects
-            r = pygame.Rect(sx - int(tile*par/2), sy - int(tile*par/2), int(tile*par), int(tile*par))
-            pygame.draw.rect(screen, (35, 95, 45), r)
+    ox, oy = layer_offset(PARALLAX_FACTORS[0])
+    pulse = ticks*0.0005
+    cloud_blits = []
+    for px, py, phase in clouds:
+        r = int(CLOUD_RADIUS * (0.8 + 0.4*math.sin(phase + pulse)))
+        cloud_blits.append((cloud_sprites[r], (int(px + ox) - r, int(py + oy) - r)))
+    screen.blits(cloud_blits, doreturn=False)
+
+    # mid layer: repeated mountains/tiles (parallax 0.7), one clipped blit
+    ox, oy = layer_offset(PARALLAX_FACTORS[1])
+    # floor, not int: ox/oy go negative, where int() would round towards the screen
+    screen.blit(mid_layer, (math.floor(ox) - tile_margin, math.floor(oy) - tile_margin))
 
     # ground layer (parallax 1.0) - tiled grid
-    par = PARALLAX_FACTORS[2]
-    screen_ground = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-    # draw grid tile lines in world space but mapped to screen
+    # at parallax 1.0 world -> screen is just minus the camera, so the first visible grid
+    # line sits at -(camera % grid_size) and the rest follow every grid_size pixels;
+    # each line is a plain fill over the two pixels the old 2px draw.line covered (int(sx), +1)
     grid_size = 80
-    # compute first grid line indices visible
-    gx0 = (camera.x // grid_size) * grid_size
-    gy0 = (camera.y // grid_size) * grid_size
-    for gx in range(int(gx0)-grid_size, int(gx0)+SCREEN_W+grid_size, grid_size):
-        sx, sy = camera.world_to_screen(gx, camera.y, parallax=par)
-        pygame.draw.line(screen, GRID_COLOR, (sx, 0), (sx, SCREEN_H), 2)
-    for gy in range(int(gy0)-grid_size, int(gy0)+SCREEN_H+grid_size, grid_size):
-        sx, sy = camera.world_to_screen(camera.x, gy, parallax=par)
-        pygame.draw.line(screen, GRID_COLOR, (0, sy), (SCREEN_W, sy), 2)
+    x = -(camera.x % grid_size)
+    if x <= -1:
+        x += grid_size  # old draw.line clipped a line left of the screen away entirely
+    while x < SCREEN_W:
+        screen.fill(GRID_COLOR, (int(x), 0, 2, SCREEN_H))
+        x += grid_size
+    y = -(camera.y % grid_size)
+    if y <= -1:
+        y += grid_size  # likewise above it
+    while y < SCREEN_H:
+        screen.fill(GRID_COLOR, (0, int(y), SCREEN_W, 2))
+        y += grid_size
 
     # fill floor as a large rectangle in world coords mapped to screen corners
     # draw a big rectangle under everything (just cover screen bottom area)
     pygame.draw.rect(screen, GROUND, (0, SCREEN_H//2, SCREEN_W, SCREEN_H//2))
 
     # --- DRAW WALLS (world -> screen) ---
-    for w in walls:
+    # only walls inside the camera view; a wall spanning several quadtree leaves comes back
+    # once per leaf, so dedupe by identity
+    view = pygame.Rect(int(camera.x), int(camera.y), SCREEN_W + 1, SCREEN_H + 1)
+    for w in {id(w): w for w in wall_tree.query(view)}.values():
         sx, sy = camera.world_to_screen(w.x, w.y, parallax=1.0)
         rect = pygame.Rect(sx, sy, w.width, w.height)
         pygame.draw.rect(screen, WALL_COLOR, rect)
 
     # --- DRAW BULLETS ---
+    bullet_view = view.inflate(8, 8)  # bullets are drawn with radius 4
     for b in bullets:
+        if not bullet_view.collidepoint(b["x"], b["y"]):
+            continue
         sx, sy = camera.world_to_screen(b["x"], b["y"], parallax=1.0)
         pygame.draw.circle(screen, BULLET_COLOR, (sx, sy), 4)
 
@@ -244,7 +351,6 @@ while running:
     pygame.draw.line(screen, (0,0,0), (px, py), (ex, ey), 3)
 
     # draw a little 'reticle' at mouse screen pos
-    mx, my = pygame.mouse.get_pos()
     pygame.draw.circle(screen, (0,0,0), (mx,my), 6, 2)
 
     # --- HUD (score/time/simple minimap) ---
@@ -252,16 +358,8 @@ while running:
     info_surf = font.render(f"World: {WORLD_W}x{WORLD_H}  Pos: ({int(player['x'])},{int(player['y'])})  Bullets: {len(bullets)}", True, (255,255,255))
     screen.blit(info_surf, (12, 12))
 
-    # minimap (scaled down view)
-    mini_w, mini_h = 240, 160
-    minimap = pygame.Surface((mini_w, mini_h))
-    minimap.fill((20, 20, 20))
-    # draw walls on minimap
-    scale_x = mini_w / WORLD_W
-    scale_y = mini_h / WORLD_H
-    for w in walls:
-        r = pygame.Rect(int(w.x * scale_x), int(w.y * scale_y), int(w.width * scale_x), int(w.height * scale_y))
-        pygame.draw.rect(minimap, (120,120,120), r)
+    # minimap (scaled down view): static walls copied in, then the moving parts on top
+    minimap.blit(minimap_walls, (0, 0))
     # draw player on minimap
     pygame.draw.circle(minimap, PLAYER_COLOR, (int(player["x"] * scale_x), int(player["y"] * scale_y)), 4)
     # draw viewport rect